@@ -13,7 +13,13 @@ Features:
 - Manage stored websites
 """
 
+import asyncio
+import queue
+import threading
+import numpy as np
+import pandas as pd
 import streamlit as st
+import xxhash
 import yaml
 from pathlib import Path
 import sys
@@ -36,6 +42,10 @@ st.set_page_config(
 )
 
 
+# Characters of each document fetched for the View All Documents page
+PREVIEW_LENGTH = 1000
+
+
 @st.cache_resource
 def load_config():
     """Load configuration from YAML file."""
@@ -54,15 +64,304 @@ def initialize_database(config):
     db_config = config.get('database', {})
     embedding_config = config.get('embedding', {})
 
-    return VectorDatabase(
+    db = VectorDatabase(
         db_type=db_config.get('type', 'chromadb'),
         chroma_path=db_config.get('chroma_path', './data/chroma'),
         sqlite_path=db_config.get('sqlite_path', './data/scraped_data.db'),
         collection_name=db_config.get('collection_name', 'website_content'),
-        embedding_model=embedding_config.get('model_name', 'all-MiniLM-L6-v2')
+        embedding_model=embedding_config.get('model_name', 'all-MiniLM-L6-v2'),
+        device=embedding_config.get('device', 'auto'),
+        cpu_encoder=embedding_config.get('cpu_encoder', 'torch'),
+        encode_workers=embedding_config.get('encode_workers', 1),
+        async_writes=db_config.get('async_writes', False),
+        chroma_batch_size=db_config.get('chroma_batch_size', 256),
+        hnsw_m=db_config.get('hnsw_m', 24),
+        hnsw_construction_ef=db_config.get('hnsw_construction_ef', 200),
+        hnsw_search_ef=db_config.get('hnsw_search_ef', 100)
+    )
+
+    if db_config.get('fast_ingest_pragmas', False):
+        db.apply_ingest_pragmas()
+
+    return db
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_cached_stats(_db: VectorDatabase) -> dict:
+    """Database stats, cached briefly so sidebar reruns skip the count query."""
+    return _db.get_stats()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_cached_documents(
+    _db: VectorDatabase,
+    website_url: str,
+    limit: int,
+    offset: int,
+    preview_length: int
+) -> list:
+    """One page of documents, cached per filter and page."""
+    return _db.get_all_documents(
+        website_url=website_url,
+        limit=limit,
+        offset=offset,
+        preview_length=preview_length
     )
 
 
+def invalidate_cached_data():
+    """Drop cached stats and documents after the database changes."""
+    get_cached_stats.clear()
+    get_cached_documents.clear()
+
+
+@st.cache_resource
+def get_url_validator():
+    """Create the URL validator once and share it across reruns."""
+    return URLValidator()
+
+
+@st.cache_resource
+def build_scraper_kwargs(scraper_items: tuple) -> dict:
+    """
+    Resolve WebScraper arguments from the scraper config, once per config.
+
+    Args:
+        scraper_items (tuple): Sorted (key, value) pairs of the scraper
+            config, so Streamlit can hash them
+
+    Returns:
+        dict: Keyword arguments for WebScraper
+    """
+    scraper_config = dict(scraper_items)
+
+    return {
+        'max_depth': scraper_config.get('max_depth', 3),
+        'max_pages': scraper_config.get('max_pages', 50),
+        'timeout': scraper_config.get('timeout', 10),
+        'delay': scraper_config.get('delay', 1),
+        'user_agent': scraper_config.get('user_agent', 'Mozilla/5.0'),
+        'max_concurrency': scraper_config.get('max_concurrency', 10),
+        'bloom_capacity': scraper_config.get('bloom_capacity'),
+        'max_visited_exact': scraper_config.get('max_visited_exact', 1000),
+        'extract_metadata': scraper_config.get('extract_metadata', True)
+    }
+
+
+def get_session_scraper(config: dict) -> WebScraper:
+    """
+    Get this session's WebScraper, building it only when the config changes.
+
+    The scraper holds per-crawl state, so it is kept in session_state rather
+    than shared across sessions with st.cache_resource.
+    """
+    scraper_items = tuple(sorted(config.get('scraper', {}).items()))
+
+    if st.session_state.get('scraper_items') != scraper_items:
+        if 'scraper' in st.session_state:
+            # Release the replaced scraper's pooled connections
+            st.session_state['scraper'].close()
+        st.session_state['scraper'] = WebScraper(**build_scraper_kwargs(scraper_items))
+        st.session_state['scraper_items'] = scraper_items
+
+    return st.session_state['scraper']
+
+
+def make_progress_reporter(progress_bar, start: int, end: int):
+    """
+    Build a progress callback that only redraws at power-of-two milestones.
+
+    Every progress_bar update is a round-trip to the browser, so updating
+    per page would dominate large crawls. The returned ``report(done,
+    total)`` redraws when ``done`` reaches 1, 2, 4, 8, ... or ``total``,
+    which keeps the number of updates logarithmic in the page count. It
+    must only be called from the script thread.
+
+    Args:
+        progress_bar: Streamlit progress bar to drive
+        start (int): Progress value (0-100) at done == 0
+        end (int): Progress value (0-100) at done == total
+
+    Returns:
+        Callable[[int, int], None]: The report callback
+    """
+    next_update = 1
+
+    def report(done: int, total: int):
+        nonlocal next_update
+        if done < next_update and done != total:
+            return
+
+        while next_update <= done:
+            next_update *= 2
+
+        progress_bar.progress(start + int((end - start) * done / total))
+
+    return report
+
+
+def filter_unchanged_pages(
+    db: VectorDatabase,
+    urls: list,
+    titles: list,
+    contents: list,
+    metadatas: list
+):
+    """
+    Drop pages whose content hash matches the one already stored.
+
+    Each kept page gets its ``content_hash`` added to a copy of its
+    metadata so the next scrape can compare against it.
+
+    Args:
+        db (VectorDatabase): Database instance
+        urls (list): Page URLs
+        titles (list): Page titles
+        contents (list): Page contents
+        metadatas (list): Page metadata dictionaries
+
+    Returns:
+        tuple: (urls, titles, contents, metadatas) of new or changed pages
+    """
+    existing = db.existing_hashes(urls)
+
+    kept = ([], [], [], [])
+    for url, title, content, metadata in zip(urls, titles, contents, metadatas):
+        content_hash = xxhash.xxh3_64_hexdigest(content)
+        if existing.get(url) == content_hash:
+            continue
+
+        kept[0].append(url)
+        kept[1].append(title)
+        kept[2].append(content)
+        kept[3].append({**metadata, 'content_hash': content_hash})
+
+    return kept
+
+
+def run_ingest_pipeline(
+    scraper: WebScraper,
+    url: str,
+    db: VectorDatabase,
+    batch_size: int,
+    on_progress
+) -> dict:
+    """
+    Scrape, embed and store a website as a three-stage pipeline.
+
+    A crawler thread groups scraped pages into batches, an embedder thread
+    drops unchanged pages and encodes the rest, and an ingest thread writes
+    them to the database. The stages are joined by queues, so the phases
+    overlap. The crawler hands batches off without blocking, so a slow
+    embedder never stalls the concurrent crawl; embedded batches go through
+    a small bounded queue, so only a few are held at once. Each stage
+    forwards a ``None`` sentinel when it is done.
+
+    Args:
+        scraper (WebScraper): Scraper to crawl with
+        url (str): Website URL to scrape
+        db (VectorDatabase): Database instance
+        batch_size (int): Pages per batch
+        on_progress (Callable[[dict], None]): Called periodically from this
+            thread with the running counters
+
+    Returns:
+        dict: Counters ('scraped', 'skipped', 'stored') and 'errors'
+    """
+    # on_page runs on the crawler's event loop, so handing a batch off must
+    # never block: a full queue would stall every crawl worker. This queue
+    # is unbounded; the scraper keeps every page anyway (up to max_pages),
+    # so a backlog here costs no extra page memory.
+    page_batches = queue.Queue()
+    embedded_batches = queue.Queue(maxsize=2)
+    counters = {'scraped': 0, 'skipped': 0, 'stored': 0, 'errors': []}
+
+    # Every page of one scrape is stored with the same ingest time
+    ingest_timestamp = datetime.now().isoformat()
+
+    def crawl():
+        batch = ([], [], [], [])
+
+        def on_page(page):
+            batch[0].append(page.url)
+            batch[1].append(page.title)
+            batch[2].append(page.content)
+            batch[3].append(page.metadata)
+            counters['scraped'] += 1
+
+            if len(batch[0]) >= batch_size:
+                page_batches.put_nowait(tuple(list(column) for column in batch))
+                for column in batch:
+                    column.clear()
+
+        try:
+            asyncio.run(scraper.scrape_website_async(url, on_page=on_page))
+            if batch[0]:
+                page_batches.put(batch)
+        except Exception as e:
+            counters['errors'].append(e)
+        finally:
+            page_batches.put(None)
+
+    def embed():
+        # Keeps draining after an error so all batches are consumed
+        while (batch := page_batches.get()) is not None:
+            if counters['errors']:
+                continue
+
+            try:
+                urls, titles, contents, metadatas = filter_unchanged_pages(db, *batch)
+                counters['skipped'] += len(batch[0]) - len(urls)
+
+                if urls:
+                    embeddings = (
+                        db.encode_documents(titles, contents)
+                        if db.encoder is not None else None
+                    )
+                    embedded_batches.put((urls, titles, contents, metadatas, embeddings))
+            except Exception as e:
+                counters['errors'].append(e)
+
+        embedded_batches.put(None)
+
+    def ingest():
+        while (batch := embedded_batches.get()) is not None:
+            if counters['errors']:
+                continue
+
+            urls, titles, contents, metadatas, embeddings = batch
+            if db.add_documents_batched(
+                urls=urls,
+                titles=titles,
+                contents=contents,
+                metadatas=metadatas,
+                website_url=url,
+                precomputed_embeddings=embeddings,
+                timestamp=ingest_timestamp
+            ):
+                counters['stored'] += len(urls)
+            else:
+                counters['errors'].append(RuntimeError("Failed to store pages in database"))
+
+    threads = [
+        threading.Thread(target=stage, name=f"ingest-{stage.__name__}", daemon=True)
+        for stage in (crawl, embed, ingest)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Only this (script) thread touches Streamlit elements
+    while threads[-1].is_alive():
+        threads[-1].join(timeout=0.25)
+        on_progress(counters)
+
+    # With async_writes the last batches may still be queued
+    if not db.flush():
+        counters['errors'].append(RuntimeError("Failed to store pages in database"))
+
+    return counters
+
+
 def scrape_and_store_website(url: str, config: dict, db: VectorDatabase):
     """
     Scrape a website and store content in the database.
@@ -72,63 +371,65 @@ def scrape_and_store_website(url: str, config: dict, db: VectorDatabase):
         config (dict): Configuration dictionary
         db (VectorDatabase): Database instance
     """
-    scraper_config = config.get('scraper', {})
-
-    # Initialize scraper
-    scraper = WebScraper(
-        max_depth=scraper_config.get('max_depth', 3),
-        max_pages=scraper_config.get('max_pages', 50),
-        timeout=scraper_config.get('timeout', 10),
-        delay=scraper_config.get('delay', 1),
-        user_agent=scraper_config.get('user_agent', 'Mozilla/5.0')
-    )
+    scraper = get_session_scraper(config)
 
     # Create progress containers
     progress_bar = st.progress(0)
     status_text = st.empty()
 
+    batch_size = config.get('database', {}).get('ingest_batch', 32)
+    report = make_progress_reporter(progress_bar, 0, 100)
+    last_counts = None
+
+    def on_progress(counters: dict):
+        nonlocal last_counts
+        counts = (counters['scraped'], counters['skipped'], counters['stored'])
+        if counts == last_counts:
+            return
+
+        last_counts = counts
+        status_text.text(
+            f"🔍 Scraped {counts[0]} pages, {counts[1]} unchanged, {counts[2]} stored..."
+        )
+        report(counts[1] + counts[2], max(scraper.max_pages, counts[0]))
+
     try:
-        # Start scraping
         status_text.text("🔍 Starting website scrape...")
-        progress_bar.progress(10)
 
-        scraped_pages = scraper.scrape_website(url)
+        counters = run_ingest_pipeline(scraper, url, db, batch_size, on_progress)
 
-        if not scraped_pages:
-            st.error("No pages were scraped. Please check the URL and try again.")
-            return None
+        progress_bar.progress(100)
 
-        progress_bar.progress(50)
-        status_text.text(f"✅ Scraped {len(scraped_pages)} pages. Storing in database...")
-
-        # Store in database
-        urls = [page.url for page in scraped_pages]
-        titles = [page.title for page in scraped_pages]
-        contents = [page.content for page in scraped_pages]
-        metadatas = [page.metadata for page in scraped_pages]
-
-        success = db.add_documents(
-            urls=urls,
-            titles=titles,
-            contents=contents,
-            metadatas=metadatas,
-            website_url=url
-        )
+        # Even a partial ingest may have changed the stored documents
+        invalidate_cached_data()
 
-        progress_bar.progress(100)
+        if counters['errors']:
+            st.error(f"Error during scraping: {counters['errors'][0]}")
+            return None
+
+        if not counters['scraped']:
+            st.error("No pages were scraped. Please check the URL and try again.")
+            return None
 
-        if success:
+        if counters['stored']:
             status_text.text("✅ Successfully stored all pages in database!")
-            return scraper.get_scrape_summary()
         else:
-            st.error("Failed to store pages in database.")
-            return None
+            status_text.text("✅ All pages are unchanged since the last scrape.")
+
+        return scraper.get_scrape_summary()
 
     except Exception as e:
         st.error(f"Error during scraping: {str(e)}")
         return None
 
 
+def format_preview(doc: dict) -> str:
+    """Add an ellipsis to a get_all_documents preview if it was truncated."""
+    if doc['content_length'] > len(doc['preview']):
+        return doc['preview'] + "..."
+    return doc['preview']
+
+
 def main():
     """Main application function."""
 
@@ -145,8 +446,8 @@ def main():
         st.error(f"Failed to initialize database: {str(e)}")
         return
 
-    # Initialize URL validator
-    url_validator = URLValidator()
+    # Get the shared URL validator
+    url_validator = get_url_validator()
 
     # Sidebar
     with st.sidebar:
@@ -155,7 +456,7 @@ def main():
 
         # Database stats
         st.subheader("📊 Database Stats")
-        stats = db.get_stats()
+        stats = get_cached_stats(db)
         st.metric("Database Type", stats.get('database_type', 'Unknown'))
         st.metric("Total Documents", stats.get('total_documents', 0))
 
@@ -276,25 +577,63 @@ def main():
             if not search_query:
                 st.warning("Please enter a search query")
             else:
-                results = db.search(
+                # Kept in session state so selecting a result doesn't drop them
+                st.session_state['search_results'] = db.search(
                     query=search_query,
                     n_results=num_results,
                     website_url=website_filter if website_filter else None
                 )
 
-                if not results:
-                    st.info("No results found")
+        if 'search_results' in st.session_state:
+            results = st.session_state['search_results']
+
+            if not results:
+                st.info("No results found")
+            else:
+                st.success(f"Found {len(results)} results")
+
+                # One Arrow-backed table instead of a widget per result,
+                # with every column derived in a single vectorized step
+                table = pd.DataFrame.from_records(results)
+                metadata = pd.DataFrame.from_records(
+                    table['metadata'].tolist(), columns=['title', 'url']
+                )
+                table['title'] = metadata['title'].fillna('Untitled')
+                table['url'] = metadata['url'].fillna('N/A')
+                table['preview'] = table['content'].str.slice(0, 500)
+
+                # NaN where the backend has no distance (SQLite keyword search)
+                scores = np.fromiter(
+                    (np.nan if r.get('distance') is None else r['distance'] for r in results),
+                    dtype=np.float32,
+                    count=len(results)
+                )
+                # A cosine distance converts to a similarity; other spaces
+                # (e.g. an older l2 collection) are shown as distances
+                if db.distance_space == "cosine":
+                    scores = 1.0 - scores
+                    score_label = "Similarity Score"
                 else:
-                    st.success(f"Found {len(results)} results")
+                    score_label = "Distance"
+                table['score'] = scores
 
-                    for i, result in enumerate(results, 1):
-                        with st.expander(f"Result {i}: {result['metadata'].get('title', 'Untitled')}"):
-                            st.markdown(f"**URL:** {result['metadata'].get('url', 'N/A')}")
-                            st.markdown(f"**Content Preview:**")
-                            st.text(result['content'][:500] + "..." if len(result['content']) > 500 else result['content'])
+                st.dataframe(
+                    table[['title', 'url', 'score', 'preview']].rename(columns={'score': score_label}),
+                    use_container_width=True
+                )
+
+                selected = st.selectbox(
+                    "View result",
+                    options=range(len(results)),
+                    format_func=lambda i: f"Result {i + 1}: {table.at[i, 'title']}"
+                )
+                result = results[selected]
 
-                            if 'distance' in result and result['distance'] is not None:
-                                st.markdown(f"**Similarity Score:** {1 - result['distance']:.4f}")
+                with st.expander(f"Result {selected + 1}: {table.at[selected, 'title']}", expanded=True):
+                    st.markdown(f"**URL:** {table.at[selected, 'url']}")
+                    if not np.isnan(scores[selected]):
+                        st.markdown(f"**{score_label}:** {scores[selected]:.4f}")
+                    st.text(result['content'])
 
     # Page: View All Documents
     elif page == "📚 View All Documents":
@@ -306,29 +645,71 @@ def main():
             help="Filter documents by website URL"
         )
 
+        col1, col2 = st.columns(2)
+
+        with col1:
+            page_size = st.number_input(
+                "Documents per page",
+                min_value=10,
+                max_value=500,
+                value=50,
+                step=10
+            )
+
+        with col2:
+            page_num = st.number_input(
+                "Page",
+                min_value=1,
+                value=1
+            )
+
+        # Keep the listing visible across reruns triggered by the widgets below
         if st.button("📥 Load Documents"):
-            documents = db.get_all_documents(
-                website_url=website_filter if website_filter else None
+            st.session_state['documents_loaded'] = True
+
+        if st.session_state.get('documents_loaded'):
+            offset = (page_num - 1) * page_size
+            documents = get_cached_documents(
+                db,
+                website_url=website_filter if website_filter else None,
+                limit=page_size,
+                offset=offset,
+                preview_length=PREVIEW_LENGTH
             )
 
             if not documents:
                 st.info("No documents found")
             else:
-                st.success(f"Found {len(documents)} documents")
-
-                # Display in a table format
-                for i, doc in enumerate(documents, 1):
-                    with st.expander(f"{i}. {doc['metadata'].get('title', 'Untitled')}"):
-                        st.markdown(f"**URL:** {doc['metadata'].get('url', 'N/A')}")
-                        st.markdown(f"**Timestamp:** {doc['metadata'].get('timestamp', 'N/A')}")
-                        st.markdown(f"**Content Length:** {len(doc['content'])} characters")
-                        st.markdown("---")
-                        st.text_area(
-                            "Content",
-                            value=doc['content'][:1000] + "..." if len(doc['content']) > 1000 else doc['content'],
-                            height=200,
-                            key=f"doc_{i}"
-                        )
+                st.success(f"Showing documents {offset + 1}-{offset + len(documents)}")
+
+                # One table for the whole page instead of a widget per document
+                listing = pd.DataFrame([
+                    {
+                        'title': doc['metadata'].get('title', 'Untitled'),
+                        'url': doc['metadata'].get('url', 'N/A'),
+                        'timestamp': doc['metadata'].get('timestamp', 'N/A'),
+                        'preview': format_preview(doc)
+                    }
+                    for doc in documents
+                ])
+                st.dataframe(listing, use_container_width=True)
+
+                # Only the selected document's content is rendered
+                selected = st.selectbox(
+                    "View document",
+                    options=range(len(documents)),
+                    format_func=lambda i: f"{offset + i + 1}. {listing.at[i, 'title']}"
+                )
+
+                # The listing only holds previews; load the selected document in full
+                document = db.get_document(listing.at[selected, 'url'])
+
+                st.markdown(f"**Content Length:** {documents[selected]['content_length']} characters")
+                st.text_area(
+                    "Content" if document else "Content (preview)",
+                    value=document['content'] if document else listing.at[selected, 'preview'],
+                    height=200
+                )
 
     # Page: Settings
     elif page == "⚙️ Settings":
@@ -377,6 +758,7 @@ def main():
 
             if confirm:
                 db.clear_collection(website_url=website_to_clear if website_to_clear else None)
+                invalidate_cached_data()
                 st.success("Database cleared successfully!")
                 st.rerun()
             else:
@@ -395,7 +777,7 @@ def main():
 
         **Tech Stack:**
         - Frontend: Streamlit
-        - Scraping: BeautifulSoup4 + Requests
+        - Scraping: selectolax + httpx (HTTP/2)
         - Database: ChromaDB (with SQLite fallback)
         - Embeddings: Sentence Transformers
 
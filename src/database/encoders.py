@@ -0,0 +1,164 @@
+"""
+Embedding Encoders Module
+
+This module provides alternative sentence encoders for the vector database.
+Encoders expose the same ``encode`` interface as
+``sentence_transformers.SentenceTransformer`` so they can be swapped in
+without touching the ingest or search code, and are callable as ChromaDB
+embedding functions.
+
+Features:
+- ONNX Runtime encoder with dynamic int8 quantization for CPU deployments
+- Quantized models are exported once and persisted to disk
+"""
+
+import os
+import logging
+from typing import List, Optional
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence encoder running on ONNX Runtime with int8 weights.
+
+    On CPU, dynamic int8 quantization lets ONNX Runtime use VNNI integer
+    GEMM kernels, which are typically several times faster than PyTorch
+    FP32 and need a quarter of the model memory. Requires
+    ``optimum[onnxruntime]``.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_dir: str = "./data/onnx",
+        num_threads: Optional[int] = None,
+        max_seq_length: int = 256
+    ):
+        """
+        Initialize the encoder, exporting and quantizing the model on first use.
+
+        Args:
+            model_name (str): Sentence transformer model name or Hugging Face id
+            cache_dir (str): Directory where the quantized model is persisted
+            num_threads (Optional[int]): ONNX Runtime intra-op threads (all cores if None)
+            max_seq_length (int): Maximum tokens per sentence, as in sentence-transformers
+
+        Raises:
+            ImportError: If optimum or onnxruntime is not installed
+        """
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        if '/' not in model_name:
+            model_name = f"sentence-transformers/{model_name}"
+
+        self.model_name = model_name
+        self.max_seq_length = max_seq_length
+        self.model_dir = os.path.join(cache_dir, model_name.replace('/', '_') + "-int8")
+
+        if not os.path.exists(os.path.join(self.model_dir, "model_quantized.onnx")):
+            self._export_quantized()
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = num_threads or os.cpu_count()
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            self.model_dir,
+            file_name="model_quantized.onnx",
+            provider="CPUExecutionProvider",
+            session_options=session_options
+        )
+
+        logger.info(f"ONNX int8 encoder ready for '{model_name}'")
+
+    def _export_quantized(self):
+        """Export the model to ONNX and save a dynamically int8-quantized copy."""
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        logger.info(f"Exporting '{self.model_name}' to ONNX (one-time)...")
+
+        model = ORTModelForFeatureExtraction.from_pretrained(self.model_name, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=self.model_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False)
+        )
+        AutoTokenizer.from_pretrained(self.model_name).save_pretrained(self.model_dir)
+
+        logger.info(f"Quantized model saved to {self.model_dir}")
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        """
+        Embed documents, following ChromaDB's EmbeddingFunction protocol.
+
+        This lets the encoder be passed as ``embedding_function`` anywhere
+        ``SentenceTransformerEmbeddingFunction`` is accepted.
+        """
+        return self.encode(list(input), normalize_embeddings=True).tolist()
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the embedding size, like SentenceTransformer."""
+        return self.model.config.hidden_size
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Encode sentences with mean pooling, like SentenceTransformer.encode.
+
+        Args:
+            sentences (List[str]): Sentences to encode
+            batch_size (int): Sentences per inference call
+            convert_to_numpy (bool): Accepted for compatibility; always returns numpy
+            normalize_embeddings (bool): L2-normalize the embeddings
+            show_progress_bar (bool): Accepted for compatibility; ignored
+
+        Returns:
+            numpy.ndarray: One embedding per sentence
+        """
+        # Smart batching: sort by length so each batch is padded only to its
+        # own longest sentence, then restore the input order at the end
+        order = np.argsort([-len(sentence) for sentence in sentences], kind="stable")
+        sorted_sentences = [sentences[i] for i in order]
+        batches = []
+
+        for start in range(0, len(sorted_sentences), batch_size):
+            inputs = self.tokenizer(
+                sorted_sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+            # Mean over real tokens only
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(embeddings.astype(np.float32))
+
+        if not batches:
+            return np.empty((0, 0), dtype=np.float32)
+
+        embeddings = np.empty((len(sentences), batches[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(batches)
+
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings
+
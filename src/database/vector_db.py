@@ -13,18 +13,120 @@ Features:
 
 import os
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
 import chromadb
 from chromadb.config import Settings
-from chromadb.utils import embedding_functions
 import sqlite3
-import json
+import orjson
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+from .encoders import OnnxSentenceEncoder
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SQLite settings for bulk ingest, applied to the SQLite fallback at connect
+# time and optionally to ChromaDB's store. WAL + synchronous=NORMAL only
+# fsyncs at checkpoints and, unlike synchronous=OFF, cannot corrupt the
+# database if the process crashes.
+INGEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=30000000000",
+    "PRAGMA cache_size=-262144",
+)
+
+# HNSW index parameters for the SQLite fallback
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 400
+HNSW_EF_SEARCH = 50
+HNSW_MIN_CAPACITY = 1024
+
+# Document IDs are URLs with '/', ':' and '.' mapped to '_'
+_ID_TRANS = str.maketrans({'/': '_', ':': '_', '.': '_'})
+
+# Stored document text: title, blank line, content
+_DOCUMENT_FORMAT = "{}\n\n{}"
+
+# Documents fetched per round trip when iterating over a collection
+DOCUMENT_PAGE_SIZE = 1000
+
+# Compiled statements kept by each SQLite connection
+SQLITE_CACHED_STATEMENTS = 256
+
+# Batches that may wait for the background ChromaDB writer
+WRITE_QUEUE_SIZE = 8
+
+# Number of distinct search queries whose embeddings are kept in memory
+QUERY_CACHE_SIZE = 1024
+
+
+def quantize_embeddings(embeddings: np.ndarray):
+    """
+    Quantize embeddings to int8 with one symmetric scale per vector.
+
+    Args:
+        embeddings (numpy.ndarray): Float embeddings, one row per vector
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: int8 vectors and their float32
+            scales; ``quantized / scale`` approximates the input
+    """
+    peak = np.max(np.abs(embeddings), axis=1, keepdims=True)
+    scales = 127.0 / np.clip(peak, 1e-12, None)
+    quantized = np.round(embeddings * scales).astype(np.int8)
+    return quantized, scales[:, 0].astype(np.float32)
+
+
+def _metadata_as_is(value):
+    """Metadata handler for the types ChromaDB stores natively."""
+    return value
+
+
+def _metadata_as_json(value) -> str:
+    """
+    Metadata handler for containers: a JSON string.
+
+    orjson handles numpy and datetime values; default=str covers anything else.
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def resolve_device(device: str = "auto") -> str:
+    """
+    Resolve the torch device used for embeddings.
+
+    Args:
+        device (str): "auto", or an explicit device such as "cpu", "cuda" or "mps"
+
+    Returns:
+        str: The explicit device, or the best available one for "auto"
+    """
+    if device != "auto":
+        return device
+
+    if torch.cuda.is_available():
+        return "cuda"
+
+    if torch.backends.mps.is_available():
+        return "mps"
+
+    return "cpu"
+
 
 class VectorDatabase:
     """
@@ -37,13 +139,40 @@ class VectorDatabase:
     - Efficient retrieval of relevant content
     """
 
+    # Metadata value handlers, looked up by exact type in _sanitize_metadata
+    _METADATA_HANDLERS = {
+        str: _metadata_as_is,
+        int: _metadata_as_is,
+        float: _metadata_as_is,
+        bool: _metadata_as_is,
+        list: _metadata_as_json,
+        dict: _metadata_as_json,
+        tuple: _metadata_as_json,
+    }
+
+    # Fixed SQL text, so sqlite3's statement cache compiles each query once
+    _INSERT_SQL = '''
+        INSERT OR REPLACE INTO scraped_content
+        (id, url, title, content, metadata, timestamp, website_url,
+         content_hash, domain, embedding, embedding_scale)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def __init__(
         self,
         db_type: str = "chromadb",
         chroma_path: str = "./data/chroma",
         sqlite_path: str = "./data/scraped_data.db",
         collection_name: str = "website_content",
-        embedding_model: str = "all-MiniLM-L6-v2"
+        embedding_model: str = "all-MiniLM-L6-v2",
+        device: str = "auto",
+        cpu_encoder: str = "torch",
+        chroma_batch_size: int = 256,
+        hnsw_m: int = 24,
+        hnsw_construction_ef: int = 200,
+        hnsw_search_ef: int = 100,
+        encode_workers: int = 1,
+        async_writes: bool = False
     ):
         """
         Initialize the VectorDatabase.
@@ -54,20 +183,86 @@ class VectorDatabase:
             sqlite_path (str): Path for SQLite database
             collection_name (str): Name of the collection
             embedding_model (str): Name of the sentence transformer model
+            device (str): Device for embeddings ("auto", "cpu", "cuda", "mps")
+            cpu_encoder (str): Encoder backend when running on CPU ("torch" or
+                "onnx" for an int8-quantized ONNX Runtime model)
+            chroma_batch_size (int): Maximum documents per ChromaDB add call
+            hnsw_m (int): HNSW graph degree for new ChromaDB collections
+            hnsw_construction_ef (int): HNSW build-time candidate list size
+                for new ChromaDB collections
+            hnsw_search_ef (int): HNSW query-time candidate list size for new
+                ChromaDB collections
+            encode_workers (int): Threads that encode shards of a batch in
+                parallel on CPU (1 encodes in the calling thread)
+            async_writes (bool): Queue ChromaDB writes to a background thread;
+                add_documents then returns once the batch is queued (see flush)
         """
         self.db_type = db_type
         self.chroma_path = chroma_path
         self.sqlite_path = sqlite_path
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self.device = resolve_device(device)
+        self.cpu_encoder = cpu_encoder
+        self.chroma_batch_size = chroma_batch_size
+        self.hnsw_m = hnsw_m
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+
+        # Larger encoder batches keep an accelerator busy; CPU prefers small ones
+        self.encode_batch_size = 64 if self.device == "cpu" else 256
+
+        # Sharded CPU encoding: split the cores between the workers so their
+        # torch thread pools don't oversubscribe the machine
+        self.encode_workers = encode_workers if self.device == "cpu" else 1
+        self._encode_executor = None
+        if self.encode_workers > 1:
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // self.encode_workers))
+            self._encode_executor = ThreadPoolExecutor(
+                max_workers=self.encode_workers,
+                thread_name_prefix="encode"
+            )
 
         self.client = None
         self.collection = None
+        self.encoder = None
+        self.hnsw_index = None
+        self.hnsw_path = os.path.splitext(sqlite_path)[0] + ".hnsw"
+        self.encoder_backend = None
         self.sqlite_conn = None
 
+        # Distance metric of the search results: "cosine" means a result's
+        # distance is 1 - cosine similarity
+        self.distance_space = None
+
+        # The SQLite connection is shared across threads; writes go one at a time
+        self._write_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+
+        # Set by apply_ingest_pragmas; _pragma_state marks the threads whose
+        # ChromaDB connection already has them
+        self._ingest_pragmas = False
+        self._pragma_state = threading.local()
+
+        # Per instance, so the cache is dropped together with the database
+        self._embed_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._encode_query)
+
         # Initialize the database
         self._initialize_database()
 
+        # Background ChromaDB writer, so callers don't wait on collection.add
+        self._write_queue = None
+        self._writer = None
+        self._failed_writes = 0
+        if async_writes and self.db_type == "chromadb":
+            self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="chroma-writer",
+                daemon=True
+            )
+            self._writer.start()
+
     def _initialize_database(self):
         """Initialize the appropriate database based on db_type."""
         if self.db_type == "chromadb":
@@ -92,18 +287,42 @@ class VectorDatabase:
                 )
             )
 
-            # Create or get collection with embedding function
-            sentence_transformer_ef = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name=self.embedding_model
-            )
+            # Documents and queries are encoded here rather than by Chroma,
+            # so the collection has no embedding function of its own
+            if self.encoder is None:
+                self.encoder = self._create_encoder()
+
+            # get_or_create_collection would overwrite the metadata of an
+            # existing collection, so the settings below only go to new ones
+            try:
+                self.collection = self.client.get_collection(
+                    name=self.collection_name,
+                    embedding_function=None
+                )
+            except ValueError:
+                self.collection = self.client.create_collection(
+                    name=self.collection_name,
+                    embedding_function=None,
+                    metadata={
+                        "description": "Website content for RAG system",
+                        # Embeddings are normalized, so the distance is 1 - cosine
+                        "hnsw:space": "cosine",
+                        # Denser graph than Chroma's defaults (M=16, ef 100/10)
+                        # for better recall and QPS on large collections
+                        "hnsw:M": self.hnsw_m,
+                        "hnsw:construction_ef": self.hnsw_construction_ef,
+                        "hnsw:search_ef": self.hnsw_search_ef
+                        # hnsw:num_threads is left out: Chroma defaults it to
+                        # the machine's CPU count each time the index loads
+                    }
+                )
 
-            self.collection = self.client.get_or_create_collection(
-                name=self.collection_name,
-                embedding_function=sentence_transformer_ef,
-                metadata={"description": "Website content for RAG system"}
-            )
+            # Collections created before cosine became the default keep the
+            # space they were created with (Chroma's default is l2)
+            self.distance_space = (self.collection.metadata or {}).get("hnsw:space", "l2")
 
             logger.info(f"ChromaDB initialized at {self.chroma_path}")
+            logger.info(f"Embedding model '{self.embedding_model}' on {self.device} ({self.encoder_backend})")
             logger.info(f"Collection '{self.collection_name}' ready")
 
         except Exception as e:
@@ -112,6 +331,28 @@ class VectorDatabase:
             self.db_type = "sqlite"
             self._initialize_sqlite()
 
+    def _create_encoder(self):
+        """
+        Create the sentence encoder used for documents and queries.
+
+        On CPU with ``cpu_encoder="onnx"`` the model runs on ONNX Runtime with
+        int8 weights; if optimum is not installed or the export fails, the
+        regular sentence-transformers model is used instead.
+        """
+        if self.device == "cpu" and self.cpu_encoder == "onnx":
+            try:
+                encoder = OnnxSentenceEncoder(
+                    model_name=self.embedding_model,
+                    cache_dir=os.path.join(self.chroma_path, "onnx")
+                )
+                self.encoder_backend = "onnx-int8"
+                return encoder
+            except Exception as e:
+                logger.warning(f"ONNX encoder unavailable, using sentence-transformers: {str(e)}")
+
+        self.encoder_backend = "torch"
+        return SentenceTransformer(self.embedding_model, device=self.device)
+
     def _initialize_sqlite(self):
         """Initialize SQLite database as fallback."""
         try:
@@ -119,9 +360,23 @@ class VectorDatabase:
             os.makedirs(os.path.dirname(self.sqlite_path), exist_ok=True)
 
             # Connect to SQLite
-            self.sqlite_conn = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            # A larger statement cache keeps every query below compiled once
+            self.sqlite_conn = sqlite3.connect(
+                self.sqlite_path,
+                check_same_thread=False,
+                cached_statements=SQLITE_CACHED_STATEMENTS
+            )
             cursor = self.sqlite_conn.cursor()
 
+            # WAL lets searches read while a batch is being written, and
+            # every later commit avoids the rollback journal's fsyncs
+            for pragma in INGEST_PRAGMAS:
+                cursor.execute(pragma)
+
+            # INSERT OR REPLACE only fires the delete trigger that keeps the
+            # full-text index in sync when recursive triggers are on
+            cursor.execute('PRAGMA recursive_triggers=ON')
+
             # Create table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS scraped_content (
@@ -131,10 +386,25 @@ class VectorDatabase:
                     content TEXT,
                     metadata TEXT,
                     timestamp TEXT,
-                    website_url TEXT
+                    website_url TEXT,
+                    content_hash TEXT,
+                    domain TEXT,
+                    embedding BLOB,
+                    embedding_scale REAL
                 )
             ''')
 
+            # Add columns missing from databases created by older versions
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(scraped_content)')}
+            for column, column_type in (
+                ('content_hash', 'TEXT'),
+                ('domain', 'TEXT'),
+                ('embedding', 'BLOB'),
+                ('embedding_scale', 'REAL')
+            ):
+                if column not in columns:
+                    cursor.execute(f'ALTER TABLE scraped_content ADD COLUMN {column} {column_type}')
+
             # Create index on URL
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_url ON scraped_content(url)
@@ -145,20 +415,233 @@ class VectorDatabase:
                 CREATE INDEX IF NOT EXISTS idx_website_url ON scraped_content(website_url)
             ''')
 
+            # Create index on domain
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_domain ON scraped_content(domain)
+            ''')
+
+            # Covering index for content hash lookups by URL
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_url_hash ON scraped_content(url, content_hash)
+            ''')
+
+            self._initialize_fts(cursor)
+
             self.sqlite_conn.commit()
             logger.info(f"SQLite database initialized at {self.sqlite_path}")
 
+            # Semantic search over int8 vectors; keyword search without an encoder
+            if self.encoder is None:
+                try:
+                    self.encoder = self._create_encoder()
+                except Exception as e:
+                    logger.warning(f"No encoder for SQLite, using keyword search: {str(e)}")
+
+            # Approximate search over the embeddings when hnswlib is installed
+            if self.encoder is not None and hnswlib is not None:
+                self._initialize_hnsw()
+
+            # Both the HNSW index and the int8 scan return 1 - cosine
+            self.distance_space = "cosine"
+
         except Exception as e:
             logger.error(f"Error initializing SQLite: {str(e)}")
             raise
 
+    def _initialize_fts(self, cursor: sqlite3.Cursor):
+        """
+        Create the FTS5 full-text index over scraped_content.
+
+        The index is an external-content table kept in sync by triggers, so
+        the text is not stored twice. It is built from the existing rows the
+        first time it is created.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scraped_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS scraped_fts USING fts5(
+                content,
+                title,
+                url UNINDEXED,
+                content='scraped_content',
+                content_rowid='rowid',
+                tokenize='porter unicode61'
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS scraped_content_ai AFTER INSERT ON scraped_content BEGIN
+                INSERT INTO scraped_fts(rowid, content, title, url)
+                VALUES (new.rowid, new.content, new.title, new.url);
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS scraped_content_ad AFTER DELETE ON scraped_content BEGIN
+                INSERT INTO scraped_fts(scraped_fts, rowid, content, title, url)
+                VALUES ('delete', old.rowid, old.content, old.title, old.url);
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS scraped_content_au AFTER UPDATE ON scraped_content BEGIN
+                INSERT INTO scraped_fts(scraped_fts, rowid, content, title, url)
+                VALUES ('delete', old.rowid, old.content, old.title, old.url);
+                INSERT INTO scraped_fts(rowid, content, title, url)
+                VALUES (new.rowid, new.content, new.title, new.url);
+            END
+        ''')
+
+        if not exists:
+            cursor.execute("INSERT INTO scraped_fts(scraped_fts) VALUES ('rebuild')")
+
+    def _initialize_hnsw(self):
+        """
+        Load the HNSW index for the SQLite fallback, or build it from the
+        stored embeddings if there is no index file yet.
+        """
+        try:
+            dim = self.encoder.get_sentence_embedding_dimension()
+            index = hnswlib.Index(space='cosine', dim=dim)
+            cursor = self.sqlite_conn.cursor()
+
+            if os.path.exists(self.hnsw_path):
+                index.load_index(self.hnsw_path)
+
+                # Rows written while the index was not maintained (e.g. without
+                # hnswlib) make it stale; its count includes deleted labels
+                cursor.execute('SELECT COUNT(*) FROM scraped_content WHERE embedding IS NOT NULL')
+                if index.get_current_count() < cursor.fetchone()[0]:
+                    os.remove(self.hnsw_path)
+                    index = hnswlib.Index(space='cosine', dim=dim)
+
+            if not os.path.exists(self.hnsw_path):
+                cursor.execute(
+                    'SELECT rowid, embedding, embedding_scale FROM scraped_content '
+                    'WHERE embedding IS NOT NULL'
+                )
+                rows = cursor.fetchall()
+
+                index.init_index(
+                    max_elements=max(HNSW_MIN_CAPACITY, 2 * len(rows)),
+                    M=HNSW_M,
+                    ef_construction=HNSW_EF_CONSTRUCTION
+                )
+
+                if rows:
+                    rowids, blobs, scales = zip(*rows)
+                    vectors = np.frombuffer(b''.join(blobs), dtype=np.int8).reshape(len(rows), dim)
+                    scales = np.asarray(scales, dtype=np.float32)[:, None]
+                    index.add_items(vectors.astype(np.float32) / scales, np.asarray(rowids))
+
+                index.save_index(self.hnsw_path)
+
+            self.hnsw_index = index
+            logger.info(f"HNSW index ready with {index.get_current_count()} vectors")
+
+        except Exception as e:
+            self.hnsw_index = None
+            logger.warning(f"HNSW index unavailable, using exact search: {str(e)}")
+
+    def _update_hnsw_index(
+        self,
+        doc_ids: List[str],
+        embeddings: Any,
+        replaced_rowids: List[int]
+    ):
+        """
+        Add freshly inserted documents to the HNSW index and persist it.
+
+        INSERT OR REPLACE gives a replaced document a new rowid, so the
+        labels of the rows it replaced are marked deleted.
+        """
+        rowids = self._rowids_for(doc_ids)
+
+        with self._index_lock:
+            for rowid in replaced_rowids:
+                try:
+                    self.hnsw_index.mark_deleted(rowid)
+                except RuntimeError:
+                    pass
+
+            needed = self.hnsw_index.get_current_count() + len(doc_ids)
+            if needed > self.hnsw_index.get_max_elements():
+                self.hnsw_index.resize_index(max(needed, 2 * self.hnsw_index.get_max_elements()))
+
+            self.hnsw_index.add_items(
+                embeddings,
+                np.asarray([rowids[doc_id] for doc_id in doc_ids])
+            )
+            self.hnsw_index.save_index(self.hnsw_path)
+
+    def _rowids_for(self, doc_ids: List[str]) -> Dict[str, int]:
+        """Map stored document IDs to their SQLite rowids."""
+        cursor = self.sqlite_conn.cursor()
+        rowids = {}
+
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f'SELECT id, rowid FROM scraped_content WHERE id IN ({placeholders})',
+                chunk
+            )
+            rowids.update(cursor.fetchall())
+
+        return rowids
+
+    def apply_ingest_pragmas(self):
+        """
+        Tune ChromaDB's underlying SQLite connections for bulk ingest.
+
+        ChromaDB keeps one SQLite connection per thread, and apart from WAL
+        the pragmas only affect the connection they run on. They are applied
+        to the calling thread's connection now, and to each other thread's
+        connection before its first ChromaDB write (e.g. the background
+        writer, or an ingest thread calling add_documents).
+
+        ChromaDB does not expose its SQLite connections, so this reaches into
+        the client's system registry. It is best effort: if the internals
+        differ in the installed ChromaDB version a warning is logged and the
+        defaults are kept.
+        """
+        if self.db_type != "chromadb":
+            return
+
+        self._ingest_pragmas = True
+        self._apply_ingest_pragmas_to_thread()
+
+    def _apply_ingest_pragmas_to_thread(self):
+        """Apply the ingest pragmas to this thread's ChromaDB connection, once."""
+        if not self._ingest_pragmas or getattr(self._pragma_state, 'applied', False):
+            return
+        self._pragma_state.applied = True
+
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB
+
+            conn = self.client._system.instance(SqliteDB)._conn_pool.connect()
+            for pragma in INGEST_PRAGMAS:
+                conn.execute(pragma)
+
+            logger.info(f"Applied bulk ingest pragmas to ChromaDB on {threading.current_thread().name}")
+
+        except Exception as e:
+            logger.warning(f"Could not apply ingest pragmas to ChromaDB: {str(e)}")
+
     def add_documents(
         self,
         urls: List[str],
         titles: List[str],
         contents: List[str],
         metadatas: Optional[List[Dict]] = None,
-        website_url: Optional[str] = None
+        website_url: Optional[str] = None,
+        embeddings: Optional[Any] = None,
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         Add multiple documents to the database.
@@ -169,29 +652,223 @@ class VectorDatabase:
             contents (List[str]): List of page contents
             metadatas (Optional[List[Dict]]): List of metadata dictionaries
             website_url (Optional[str]): Base website URL for grouping
+            embeddings (Optional[Any]): Precomputed embeddings; encoded from
+                titles and contents when omitted
+            timestamp (Optional[str]): ISO timestamp stored with every
+                document (the time of the call if None)
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful (or queued, with async_writes), False otherwise
         """
-        if not urls or len(urls) != len(titles) or len(urls) != len(contents):
-            logger.error("URLs, titles, and contents must have the same length")
+        if not self._check_lengths(urls, titles, contents):
             return False
 
+        timestamp = timestamp or datetime.now().isoformat()
+
+        # One contiguous float32 buffer, whatever the caller passed
+        if embeddings is not None:
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+        if self._write_queue is not None:
+            # Blocks only while WRITE_QUEUE_SIZE batches are already waiting
+            self._write_queue.put(
+                (urls, titles, contents, metadatas, website_url, embeddings, timestamp)
+            )
+            return True
+
         try:
             if self.db_type == "chromadb":
-                return self._add_documents_chromadb(urls, titles, contents, metadatas, website_url)
+                return self._add_documents_chromadb(
+                    urls, titles, contents, metadatas, website_url, embeddings, timestamp
+                )
             else:
-                return self._add_documents_sqlite(urls, titles, contents, metadatas, website_url)
+                return self._add_documents_sqlite(
+                    urls, titles, contents, metadatas, website_url, embeddings, timestamp
+                )
         except Exception as e:
             logger.error(f"Error adding documents: {str(e)}")
             return False
 
+    def _writer_loop(self):
+        """Drain the write queue into ChromaDB until close() sends None."""
+        while True:
+            payload = self._write_queue.get()
+            try:
+                if payload is None:
+                    return
+
+                if not self._add_documents_chromadb(*payload):
+                    self._failed_writes += 1
+            finally:
+                self._write_queue.task_done()
+
+    def flush(self) -> bool:
+        """
+        Wait until all queued writes are stored.
+
+        Returns:
+            bool: True if every write since the last flush succeeded (always
+                True without async_writes, where add_documents reports errors)
+        """
+        if self._write_queue is None:
+            return True
+
+        self._write_queue.join()
+
+        failed, self._failed_writes = self._failed_writes, 0
+        if failed:
+            logger.error(f"{failed} queued ChromaDB writes failed")
+
+        return failed == 0
+
+    def add_documents_batched(
+        self,
+        urls: List[str],
+        titles: List[str],
+        contents: List[str],
+        metadatas: Optional[List[Dict]] = None,
+        website_url: Optional[str] = None,
+        precomputed_embeddings: Optional[Any] = None,
+        timestamp: Optional[str] = None
+    ) -> bool:
+        """
+        Add one ingest batch, embedding it with a single encoder call.
+
+        Callers are expected to slice large crawls into batches and call this
+        once per slice. The batch is encoded up front (unless embeddings are
+        supplied) and the vectors are passed straight to the backend.
+
+        Args:
+            urls (List[str]): List of page URLs
+            titles (List[str]): List of page titles
+            contents (List[str]): List of page contents
+            metadatas (Optional[List[Dict]]): List of metadata dictionaries
+            website_url (Optional[str]): Base website URL for grouping
+            precomputed_embeddings (Optional[Any]): Embeddings for this batch
+            timestamp (Optional[str]): ISO timestamp shared by all batches of
+                one ingest (the time of the call if None)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self._check_lengths(urls, titles, contents):
+            return False
+
+        if self.encoder is not None and precomputed_embeddings is None:
+            try:
+                precomputed_embeddings = self.encode_documents(titles, contents)
+            except Exception as e:
+                logger.error(f"Error encoding documents: {str(e)}")
+                return False
+
+        return self.add_documents(
+            urls=urls,
+            titles=titles,
+            contents=contents,
+            metadatas=metadatas,
+            website_url=website_url,
+            embeddings=precomputed_embeddings,
+            timestamp=timestamp
+        )
+
+    def encode_documents(
+        self,
+        titles: List[str],
+        contents: List[str],
+        batch_size: Optional[int] = None
+    ) -> Any:
+        """
+        Encode documents with the database's sentence encoder.
+
+        Documents are built the same way they are stored (title, blank line, content).
+
+        Args:
+            titles (List[str]): List of page titles
+            contents (List[str]): List of page contents
+            batch_size (Optional[int]): Encoder mini-batch size (device default if None)
+
+        Returns:
+            numpy.ndarray: One normalized embedding per document
+        """
+        documents = self._build_documents(titles, contents)
+
+        return self._encode(documents, batch_size)
+
+    def _encode(self, texts: List[str], batch_size: Optional[int] = None) -> Any:
+        """
+        Encode texts into normalized embeddings.
+
+        sentence-transformers sorts the texts by length before batching, so
+        each mini-batch is padded only to its own longest text.
+        """
+        if self.encoder is None:
+            raise RuntimeError("No sentence encoder is available")
+
+        batch_size = batch_size or self.encode_batch_size
+
+        if self._encode_executor is not None and len(texts) > batch_size:
+            # One contiguous shard per worker, concatenated in input order
+            shard_size = -(-len(texts) // self.encode_workers)
+            shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+            futures = [
+                self._encode_executor.submit(self._encode_shard, shard, batch_size)
+                for shard in shards
+            ]
+            return np.concatenate([future.result() for future in futures])
+
+        return self._encode_shard(texts, batch_size)
+
+    def _encode_shard(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Encode texts in the calling thread."""
+        return self.encoder.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        Encode one search query; wrapped in an LRU cache as ``_embed_query``.
+
+        The cached vector is shared between calls, so it is read-only.
+        """
+        vector = self._encode([query])[0]
+        vector.flags.writeable = False
+        return vector
+
+    @staticmethod
+    def _build_documents(titles: List[str], contents: List[str]) -> List[str]:
+        """
+        Join titles and contents into the stored document texts.
+
+        map() over a bound str.format runs the loop in C. The result must be
+        a list: the encoder sorts its input by length, so it needs len() and
+        indexing, and ChromaDB stores the same texts.
+        """
+        return list(map(_DOCUMENT_FORMAT.format, titles, contents))
+
+    @staticmethod
+    def _url_to_id(url: str) -> str:
+        """Build the stored document ID for a URL, in a single pass over it."""
+        return url.translate(_ID_TRANS)
+
+    @staticmethod
+    def _check_lengths(urls: List[str], titles: List[str], contents: List[str]) -> bool:
+        """Check that the per-document lists are non-empty and aligned."""
+        if not urls or len(urls) != len(titles) or len(urls) != len(contents):
+            logger.error("URLs, titles, and contents must have the same length")
+            return False
+        return True
+
     def _sanitize_metadata(self, metadata: Dict) -> Dict:
         """
         Sanitize metadata for ChromaDB by converting complex types to simple types.
 
         ChromaDB only accepts str, int, float, and bool values in metadata.
-        This method converts or removes complex types like lists and dicts.
+        This method converts lists, dicts and tuples to JSON strings, other
+        types to str, and drops None values.
 
         Args:
             metadata (Dict): Original metadata dictionary
@@ -200,28 +877,22 @@ class VectorDatabase:
             Dict: Sanitized metadata with only simple types
         """
         sanitized = {}
+        handlers = self._METADATA_HANDLERS
 
         for key, value in metadata.items():
             if value is None:
                 continue
-            elif isinstance(value, (str, int, float, bool)):
-                # Simple types are fine
-                sanitized[key] = value
-            elif isinstance(value, (list, dict)):
-                # Convert complex types to JSON string
-                try:
-                    sanitized[key] = json.dumps(value)
-                except (TypeError, ValueError):
-                    # If can't serialize, skip this field
-                    logger.warning(f"Skipping metadata field '{key}' - cannot serialize")
-                    continue
-            else:
-                # Try to convert to string
-                try:
-                    sanitized[key] = str(value)
-                except:
-                    logger.warning(f"Skipping metadata field '{key}' - cannot convert to string")
-                    continue
+
+            handler = handlers.get(type(value))
+            if handler is None:
+                # Subclasses such as numpy.float64, IntEnum or OrderedDict
+                # are handled like their base type; anything else becomes str
+                handler = next(
+                    (h for base, h in handlers.items() if isinstance(value, base)),
+                    str
+                )
+
+            sanitized[key] = handler(value)
 
         return sanitized
 
@@ -231,37 +902,51 @@ class VectorDatabase:
         titles: List[str],
         contents: List[str],
         metadatas: Optional[List[Dict]],
-        website_url: Optional[str]
+        website_url: Optional[str],
+        embeddings: Optional[Any],
+        timestamp: str
     ) -> bool:
         """Add documents to ChromaDB."""
         try:
+            self._apply_ingest_pragmas_to_thread()
+
             # Prepare IDs (use URL as ID, replacing special characters)
-            ids = [url.replace('/', '_').replace(':', '_').replace('.', '_') for url in urls]
+            ids = [self._url_to_id(url) for url in urls]
 
             # Prepare documents (combine title and content)
-            documents = [f"{title}\n\n{content}" for title, content in zip(titles, contents)]
+            documents = self._build_documents(titles, contents)
 
-            # Prepare metadata
-            if metadatas is None:
-                metadatas = [{} for _ in urls]
+            # Prepare metadata in one pass. The caller's dicts are left
+            # untouched: each one is sanitized into a new dict, which then
+            # gets the url, title, domain, website_url and timestamp fields.
+            sanitized_metadatas = []
 
-            # Add website_url and title to metadata
             for i, (url, title) in enumerate(zip(urls, titles)):
-                metadatas[i]['url'] = url
-                metadatas[i]['title'] = title
+                metadata = self._sanitize_metadata(metadatas[i]) if metadatas else {}
+                metadata['url'] = url
+                metadata['title'] = title
+                metadata['domain'] = urlparse(url).netloc
                 if website_url:
-                    metadatas[i]['website_url'] = website_url
-                metadatas[i]['timestamp'] = datetime.now().isoformat()
-
-            # Sanitize metadata to remove complex types
-            sanitized_metadatas = [self._sanitize_metadata(meta) for meta in metadatas]
-
-            # Add to collection
-            self.collection.add(
-                ids=ids,
-                documents=documents,
-                metadatas=sanitized_metadatas
-            )
+                    metadata['website_url'] = website_url
+                metadata['timestamp'] = timestamp
+                sanitized_metadatas.append(metadata)
+
+            if embeddings is None:
+                embeddings = np.ascontiguousarray(self._encode(documents), dtype=np.float32)
+
+            # Add to collection in sub-batches; ChromaDB slows down sharply on
+            # oversized payloads. ChromaDB 0.4 only accepts embeddings as
+            # lists, so each slice is converted on its own rather than the
+            # whole batch at once.
+            step = self.chroma_batch_size
+            for start in range(0, len(ids), step):
+                end = start + step
+                self.collection.add(
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end].tolist(),
+                    documents=documents[start:end],
+                    metadatas=sanitized_metadatas[start:end]
+                )
 
             logger.info(f"Added {len(urls)} documents to ChromaDB")
             return True
@@ -276,36 +961,56 @@ class VectorDatabase:
         titles: List[str],
         contents: List[str],
         metadatas: Optional[List[Dict]],
-        website_url: Optional[str]
+        website_url: Optional[str],
+        embeddings: Optional[Any],
+        timestamp: str
     ) -> bool:
-        """Add documents to SQLite."""
+        """Add documents to SQLite, with int8 embeddings when an encoder is available."""
         try:
-            cursor = self.sqlite_conn.cursor()
+            if metadatas is None:
+                metadatas = [{} for _ in urls]
+
+            if embeddings is None and self.encoder is not None:
+                embeddings = self.encode_documents(titles, contents)
 
-            for i, (url, title, content) in enumerate(zip(urls, titles, contents)):
-                # Prepare metadata
-                metadata = metadatas[i] if metadatas and i < len(metadatas) else {}
-                metadata_json = json.dumps(metadata)
-
-                # Generate ID
-                doc_id = url.replace('/', '_').replace(':', '_').replace('.', '_')
-
-                # Insert or replace
-                cursor.execute('''
-                    INSERT OR REPLACE INTO scraped_content
-                    (id, url, title, content, metadata, timestamp, website_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    doc_id,
+            if embeddings is not None:
+                quantized, scales = quantize_embeddings(embeddings)
+                vectors = [(q.tobytes(), float(scale)) for q, scale in zip(quantized, scales)]
+            else:
+                vectors = [(None, None)] * len(urls)
+
+            rows = [
+                (
+                    self._url_to_id(url),
                     url,
                     title,
                     content,
-                    metadata_json,
-                    datetime.now().isoformat(),
-                    website_url or ''
-                ))
+                    orjson.dumps(metadata, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+                    timestamp,
+                    website_url or '',
+                    metadata.get('content_hash'),
+                    urlparse(url).netloc,
+                    embedding,
+                    scale
+                )
+                for url, title, content, metadata, (embedding, scale)
+                in zip(urls, titles, contents, metadatas, vectors)
+            ]
+
+            doc_ids = [row[0] for row in rows]
+
+            with self._write_lock:
+                index_vectors = self.hnsw_index is not None and embeddings is not None
+                replaced_rowids = list(self._rowids_for(doc_ids).values()) if index_vectors else []
+
+                # sqlite3 opens a transaction before the first INSERT, so the
+                # whole batch is written in one transaction with one commit
+                self.sqlite_conn.executemany(self._INSERT_SQL, rows)
+                self.sqlite_conn.commit()
+
+                if index_vectors:
+                    self._update_hnsw_index(doc_ids, embeddings, replaced_rowids)
 
-            self.sqlite_conn.commit()
             logger.info(f"Added {len(urls)} documents to SQLite")
             return True
 
@@ -313,11 +1018,60 @@ class VectorDatabase:
             logger.error(f"Error adding documents to SQLite: {str(e)}")
             return False
 
+    def existing_hashes(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Look up the stored content hashes for the given URLs.
+
+        Used to skip re-embedding pages whose content has not changed since
+        they were last stored.
+
+        Args:
+            urls (List[str]): Page URLs to look up
+
+        Returns:
+            Dict[str, str]: Mapping of URL to stored content hash, for URLs
+                that are already stored with a hash
+        """
+        if not urls:
+            return {}
+
+        try:
+            hashes = {}
+
+            if self.db_type == "chromadb":
+                ids = [self._url_to_id(url) for url in urls]
+                results = self.collection.get(ids=ids, include=["metadatas"])
+
+                for metadata in results['metadatas'] or []:
+                    if metadata and metadata.get('content_hash'):
+                        hashes[metadata['url']] = metadata['content_hash']
+
+            else:
+                cursor = self.sqlite_conn.cursor()
+
+                # Stay well below SQLite's bound parameter limit
+                for start in range(0, len(urls), 500):
+                    chunk = urls[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(
+                        f'SELECT url, content_hash FROM scraped_content '
+                        f'WHERE url IN ({placeholders}) AND content_hash IS NOT NULL',
+                        chunk
+                    )
+                    hashes.update(cursor.fetchall())
+
+            return hashes
+
+        except Exception as e:
+            logger.error(f"Error looking up content hashes: {str(e)}")
+            return {}
+
     def search(
         self,
         query: str,
         n_results: int = 5,
-        website_url: Optional[str] = None
+        website_url: Optional[str] = None,
+        domain: Optional[str] = None
     ) -> List[Dict]:
         """
         Search for similar documents.
@@ -326,35 +1080,58 @@ class VectorDatabase:
             query (str): Search query
             n_results (int): Number of results to return
             website_url (Optional[str]): Filter by website URL
+            domain (Optional[str]): Filter by page host, e.g. "example.com",
+                across every website it was scraped under
 
         Returns:
             List[Dict]: List of search results with content and metadata
         """
+        filters = self._search_filters(website_url, domain)
         try:
             if self.db_type == "chromadb":
-                return self._search_chromadb(query, n_results, website_url)
+                return self._search_chromadb(query, n_results, filters)
             else:
-                return self._search_sqlite(query, n_results, website_url)
+                return self._search_sqlite(query, n_results, filters)
         except Exception as e:
             logger.error(f"Error searching: {str(e)}")
             return []
 
+    @staticmethod
+    def _search_filters(
+        website_url: Optional[str],
+        domain: Optional[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Exact-match (field, value) filters for a search.
+
+        website_url matches the same documents that get_all_documents and
+        clear_collection do; domain is only applied when asked for.
+        """
+        filters = []
+        if website_url:
+            filters.append(('website_url', website_url))
+        if domain:
+            filters.append(('domain', domain))
+        return filters
+
     def _search_chromadb(
         self,
         query: str,
         n_results: int,
-        website_url: Optional[str]
+        filters: List[Tuple[str, str]]
     ) -> List[Dict]:
         """Search using ChromaDB."""
         try:
             # Prepare where clause for filtering
             where = None
-            if website_url:
-                where = {"website_url": website_url}
+            if len(filters) == 1:
+                where = dict(filters)
+            elif filters:
+                where = {"$and": [{field: value} for field, value in filters]}
 
             # Query the collection
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed_query(query).tolist()],
                 n_results=n_results,
                 where=where
             )
@@ -379,25 +1156,40 @@ class VectorDatabase:
         self,
         query: str,
         n_results: int,
-        website_url: Optional[str]
+        filters: List[Tuple[str, str]]
     ) -> List[Dict]:
-        """Search using SQLite (basic text matching)."""
+        """Search using SQLite (int8 vector search, or full-text search without an encoder)."""
         try:
+            if self.encoder is not None:
+                results = self._search_sqlite_vectors(query, n_results, filters)
+                if results is not None:
+                    return results
+
             cursor = self.sqlite_conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
-            # Build query
+            # Build query. The full-text match and its ranking run first,
+            # inside FTS5 only; the hits are then joined to scraped_content by
+            # rowid, so each one is a primary key seek. The query is matched
+            # as one quoted FTS5 phrase, so its own quotes and operators are
+            # taken literally.
             sql_query = '''
-                SELECT url, title, content, metadata
-                FROM scraped_content
-                WHERE content LIKE ?
+                WITH hits AS (
+                    SELECT rowid, bm25(scraped_fts) AS rank
+                    FROM scraped_fts
+                    WHERE scraped_fts MATCH ?
+                )
+                SELECT c.url, c.title, c.content, c.metadata
+                FROM hits
+                JOIN scraped_content AS c ON c.rowid = hits.rowid
             '''
-            params = [f'%{query}%']
+            params = ['"' + query.replace('"', '""') + '"']
 
-            if website_url:
-                sql_query += ' AND website_url = ?'
-                params.append(website_url)
+            if filters:
+                sql_query += ' WHERE ' + ' AND '.join(f'c.{field} = ?' for field, _ in filters)
+                params.extend(value for _, value in filters)
 
-            sql_query += ' LIMIT ?'
+            sql_query += ' ORDER BY hits.rank LIMIT ?'
             params.append(n_results)
 
             cursor.execute(sql_query, params)
@@ -406,14 +1198,13 @@ class VectorDatabase:
             # Format results
             formatted_results = []
             for row in rows:
-                url, title, content, metadata_json = row
-                metadata = json.loads(metadata_json) if metadata_json else {}
+                metadata = orjson.loads(row['metadata']) if row['metadata'] else {}
 
                 formatted_results.append({
-                    'content': content,
+                    'content': row['content'],
                     'metadata': {
-                        'url': url,
-                        'title': title,
+                        'url': row['url'],
+                        'title': row['title'],
                         **metadata
                     }
                 })
@@ -424,96 +1215,383 @@ class VectorDatabase:
             logger.error(f"Error searching SQLite: {str(e)}")
             return []
 
-    def get_all_documents(self, website_url: Optional[str] = None) -> List[Dict]:
+    def _search_sqlite_vectors(
+        self,
+        query: str,
+        n_results: int,
+        filters: List[Tuple[str, str]]
+    ) -> Optional[List[Dict]]:
+        """
+        Cosine search over the stored embeddings.
+
+        Uses the HNSW index when it is available, and an exact scan over the
+        int8 embeddings otherwise. Returns None if no stored document has an
+        embedding yet, so the caller can fall back to full-text search.
+        """
+        query_vector = self._embed_query(query)
+
+        hits = None
+        if self.hnsw_index is not None:
+            hits = self._query_hnsw(query_vector, n_results, filters)
+        if hits is None:
+            hits = self._query_int8_vectors(query_vector, n_results, filters)
+        if hits is None:
+            return None
+        if not hits:
+            return []
+
+        cursor = self.sqlite_conn.cursor()
+        cursor.row_factory = sqlite3.Row
+
+        top_rowids = [rowid for rowid, _ in hits]
+        placeholders = ','.join('?' * len(top_rowids))
+        cursor.execute(
+            f'SELECT rowid, url, title, content, metadata FROM scraped_content '
+            f'WHERE rowid IN ({placeholders})',
+            top_rowids
+        )
+        documents = {row['rowid']: row for row in cursor.fetchall()}
+
+        # Format results
+        formatted_results = []
+        for rowid, distance in hits:
+            if rowid not in documents:
+                continue
+
+            row = documents[rowid]
+            metadata = orjson.loads(row['metadata']) if row['metadata'] else {}
+
+            formatted_results.append({
+                'content': row['content'],
+                'metadata': {
+                    'url': row['url'],
+                    'title': row['title'],
+                    **metadata
+                },
+                'distance': distance
+            })
+
+        return formatted_results
+
+    def _query_hnsw(
+        self,
+        query_vector: np.ndarray,
+        n_results: int,
+        filters: List[Tuple[str, str]]
+    ) -> Optional[List[Tuple[int, float]]]:
+        """
+        Approximate nearest neighbours from the HNSW index.
+
+        Returns (rowid, distance) pairs, or None if the index cannot answer
+        the query (empty, or fewer live matches than requested).
+        """
+        allowed = None
+        if filters:
+            cursor = self.sqlite_conn.cursor()
+            cursor.execute(
+                'SELECT rowid FROM scraped_content WHERE embedding IS NOT NULL AND '
+                + ' AND '.join(f'{field} = ?' for field, _ in filters),
+                [value for _, value in filters]
+            )
+            allowed = {row[0] for row in cursor.fetchall()}
+            available = len(allowed)
+        else:
+            available = self.hnsw_index.get_current_count()
+
+        k = min(n_results, available)
+        if k <= 0:
+            return None
+
+        try:
+            with self._index_lock:
+                self.hnsw_index.set_ef(max(HNSW_EF_SEARCH, k))
+                labels, distances = self.hnsw_index.knn_query(
+                    query_vector,
+                    k=k,
+                    filter=(lambda label: label in allowed) if allowed is not None else None
+                )
+        except RuntimeError as e:
+            logger.warning(f"HNSW query failed, using exact search: {str(e)}")
+            return None
+
+        return list(zip(labels[0].tolist(), distances[0].tolist()))
+
+    def _query_int8_vectors(
+        self,
+        query_vector: np.ndarray,
+        n_results: int,
+        filters: List[Tuple[str, str]]
+    ) -> Optional[List[Tuple[int, float]]]:
+        """
+        Exact cosine search over the stored int8 embeddings.
+
+        Returns (rowid, distance) pairs, or None if no stored document has
+        an embedding.
+        """
+        cursor = self.sqlite_conn.cursor()
+
+        sql_query = '''
+            SELECT rowid, embedding, embedding_scale
+            FROM scraped_content
+            WHERE embedding IS NOT NULL
+        '''
+        params = []
+
+        if filters:
+            sql_query += ''.join(f' AND {field} = ?' for field, _ in filters)
+            params.extend(value for _, value in filters)
+
+        cursor.execute(sql_query, params)
+        rows = cursor.fetchall()
+
+        if not rows:
+            return None
+
+        k = min(n_results, len(rows))
+        if k <= 0:
+            return []
+
+        rowids, blobs, scales = zip(*rows)
+        vectors = np.frombuffer(b''.join(blobs), dtype=np.int8).reshape(len(rows), -1)
+
+        # Dequantize after the dot product: (q / scale) . v == (q . v) / scale
+        similarities = (vectors @ query_vector) / np.asarray(scales, dtype=np.float32)
+
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+
+        return [(rowids[i], float(1.0 - similarities[i])) for i in top]
+
+    def get_all_documents(
+        self,
+        website_url: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        preview_length: Optional[int] = None
+    ) -> List[Dict]:
         """
         Get all documents, optionally filtered by website URL.
 
+        Materializes iter_all_documents; prefer that for large collections.
+
         Args:
             website_url (Optional[str]): Filter by website URL
+            limit (Optional[int]): Maximum number of documents to return (all if None)
+            offset (int): Number of documents to skip, for pagination
+            preview_length (Optional[int]): If set, return only the first
+                ``preview_length`` characters of each document as ``preview``
+                plus its full ``content_length``, instead of ``content``
 
         Returns:
             List[Dict]: List of all documents
         """
         try:
-            if self.db_type == "chromadb":
-                # ChromaDB doesn't have a direct "get all" method, use peek
-                results = self.collection.get()
-                formatted_results = []
+            return list(self.iter_all_documents(website_url, limit, offset, preview_length))
+        except Exception as e:
+            logger.error(f"Error getting documents: {str(e)}")
+            return []
 
-                for i, doc in enumerate(results['documents']):
-                    metadata = results['metadatas'][i] if results['metadatas'] else {}
+    def iter_all_documents(
+        self,
+        website_url: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        preview_length: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Iterate over documents page by page, optionally filtered by website URL.
 
-                    # Filter by website_url if provided
-                    if website_url and metadata.get('website_url') != website_url:
-                        continue
+        The website filter runs in the database, and at most one page of
+        ``DOCUMENT_PAGE_SIZE`` documents is held in memory at a time.
 
-                    formatted_results.append({
-                        'content': doc,
-                        'metadata': metadata
-                    })
+        Args:
+            website_url (Optional[str]): Filter by website URL
+            limit (Optional[int]): Maximum number of documents to yield (all if None)
+            offset (int): Number of documents to skip, for pagination
+            preview_length (Optional[int]): If set, yield previews instead of
+                full content (see get_all_documents)
+
+        Yields:
+            Dict: One document at a time
+        """
+        if self.db_type == "chromadb":
+            where = {"website_url": website_url} if website_url else None
+            remaining = limit
+
+            while remaining is None or remaining > 0:
+                page_size = DOCUMENT_PAGE_SIZE if remaining is None else min(remaining, DOCUMENT_PAGE_SIZE)
+                results = self.collection.get(
+                    where=where,
+                    limit=page_size,
+                    offset=offset or None,
+                    include=["documents", "metadatas"]
+                )
+
+                documents = results['documents'] or []
+                metadatas = results['metadatas'] or [{}] * len(documents)
+
+                for doc, metadata in zip(documents, metadatas):
+                    text = doc if preview_length is None else doc[:preview_length]
+                    yield self._format_document(text, len(doc), metadata or {}, preview_length)
 
-                return formatted_results
+                if len(documents) < page_size:
+                    return
 
+                offset += len(documents)
+                if remaining is not None:
+                    remaining -= len(documents)
+
+        else:
+            cursor = self.sqlite_conn.cursor()
+            cursor.row_factory = sqlite3.Row
+
+            # Truncate in SQLite so full documents never reach Python
+            if preview_length is not None:
+                sql_query = (
+                    'SELECT url, title, substr(content, 1, ?) AS text, '
+                    'length(content) AS content_length, metadata '
+                    'FROM scraped_content'
+                )
+                params = [preview_length]
             else:
-                cursor = self.sqlite_conn.cursor()
+                sql_query = (
+                    'SELECT url, title, content AS text, '
+                    'length(content) AS content_length, metadata '
+                    'FROM scraped_content'
+                )
+                params = []
 
-                if website_url:
-                    cursor.execute(
-                        'SELECT url, title, content, metadata FROM scraped_content WHERE website_url = ?',
-                        (website_url,)
-                    )
-                else:
-                    cursor.execute('SELECT url, title, content, metadata FROM scraped_content')
+            if website_url:
+                sql_query += ' WHERE website_url = ?'
+                params.append(website_url)
 
-                rows = cursor.fetchall()
+            if limit is not None or offset:
+                sql_query += ' LIMIT ? OFFSET ?'
+                params.extend([limit if limit is not None else -1, offset])
 
-                formatted_results = []
-                for row in rows:
-                    url, title, content, metadata_json = row
-                    metadata = json.loads(metadata_json) if metadata_json else {}
+            cursor.execute(sql_query, params)
 
-                    formatted_results.append({
-                        'content': content,
-                        'metadata': {
-                            'url': url,
-                            'title': title,
+            while rows := cursor.fetchmany(DOCUMENT_PAGE_SIZE):
+                for row in rows:
+                    metadata = orjson.loads(row['metadata']) if row['metadata'] else {}
+
+                    yield self._format_document(
+                        row['text'],
+                        row['content_length'],
+                        {
+                            'url': row['url'],
+                            'title': row['title'],
                             **metadata
-                        }
-                    })
+                        },
+                        preview_length
+                    )
 
-                return formatted_results
+    def get_document(self, url: str) -> Optional[Dict]:
+        """
+        Get one document's full content by its page URL.
+
+        Args:
+            url (str): URL of the page the document was stored for
+
+        Returns:
+            Optional[Dict]: The document, shaped like a get_all_documents
+                entry with full content, or None if it is not stored
+        """
+        try:
+            doc_id = self._url_to_id(url)
+
+            if self.db_type == "chromadb":
+                results = self.collection.get(ids=[doc_id], include=["documents", "metadatas"])
+                if not results['documents']:
+                    return None
+
+                doc = results['documents'][0]
+                metadata = results['metadatas'][0] if results['metadatas'] else {}
+                return self._format_document(doc, len(doc), metadata or {}, None)
+
+            cursor = self.sqlite_conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                'SELECT url, title, content, metadata FROM scraped_content WHERE id = ?',
+                (doc_id,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+
+            metadata = orjson.loads(row['metadata']) if row['metadata'] else {}
+            return self._format_document(
+                row['content'],
+                len(row['content']),
+                {
+                    'url': row['url'],
+                    'title': row['title'],
+                    **metadata
+                },
+                None
+            )
 
         except Exception as e:
-            logger.error(f"Error getting documents: {str(e)}")
-            return []
+            logger.error(f"Error getting document: {str(e)}")
+            return None
+
+    @staticmethod
+    def _format_document(
+        text: str,
+        content_length: int,
+        metadata: Dict,
+        preview_length: Optional[int]
+    ) -> Dict:
+        """Build a get_all_documents entry, as full content or as a preview."""
+        if preview_length is None:
+            return {'content': text, 'metadata': metadata}
+
+        return {
+            'preview': text,
+            'content_length': content_length,
+            'metadata': metadata
+        }
 
     def clear_collection(self, website_url: Optional[str] = None):
         """
         Clear the collection or specific website documents.
 
+        Queued writes are flushed first, so documents already handed to the
+        background writer cannot reappear after the clear.
+
         Args:
             website_url (Optional[str]): If provided, only delete this website's documents
         """
         try:
+            self.flush()
+
             if self.db_type == "chromadb":
                 if website_url:
-                    # Delete specific documents
-                    results = self.collection.get(where={"website_url": website_url})
-                    if results['ids']:
-                        self.collection.delete(ids=results['ids'])
-                        logger.info(f"Deleted {len(results['ids'])} documents for {website_url}")
+                    # Delete specific documents; the filter runs inside Chroma,
+                    # so no documents or metadata are fetched first
+                    self.collection.delete(where={"website_url": website_url})
+                    logger.info(f"Deleted documents for {website_url}")
                 else:
                     # Clear entire collection
                     self.client.delete_collection(self.collection_name)
                     self._initialize_chromadb()
                     logger.info("Collection cleared")
             else:
-                cursor = self.sqlite_conn.cursor()
-                if website_url:
-                    cursor.execute('DELETE FROM scraped_content WHERE website_url = ?', (website_url,))
-                else:
-                    cursor.execute('DELETE FROM scraped_content')
-                self.sqlite_conn.commit()
+                # Same lock as the inserts, so a concurrent batch lands
+                # entirely before or after the clear, index included
+                with self._write_lock:
+                    cursor = self.sqlite_conn.cursor()
+                    if website_url:
+                        cursor.execute('DELETE FROM scraped_content WHERE website_url = ?', (website_url,))
+                    else:
+                        cursor.execute('DELETE FROM scraped_content')
+                    self.sqlite_conn.commit()
+
+                    # Rebuild the HNSW index from the remaining rows
+                    if self.hnsw_index is not None:
+                        if os.path.exists(self.hnsw_path):
+                            os.remove(self.hnsw_path)
+                        self._initialize_hnsw()
                 logger.info("Database cleared")
 
         except Exception as e:
@@ -533,7 +1611,9 @@ class VectorDatabase:
                     'database_type': 'ChromaDB',
                     'collection_name': self.collection_name,
                     'total_documents': count,
-                    'embedding_model': self.embedding_model
+                    'embedding_model': self.embedding_model,
+                    'device': self.device,
+                    'encoder_backend': self.encoder_backend
                 }
             else:
                 cursor = self.sqlite_conn.cursor()
@@ -552,6 +1632,15 @@ class VectorDatabase:
 
     def close(self):
         """Close database connections."""
+        if self._writer:
+            # Queued writes are stored before the writer stops
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+        if self._encode_executor:
+            self._encode_executor.shutdown(wait=False)
+
         if self.sqlite_conn:
             self.sqlite_conn.close()
             logger.info("SQLite connection closed")
@@ -10,29 +10,71 @@ Features:
 - Respects crawl depth and page limits
 - Handles errors gracefully
 - Implements polite crawling with delays
+- Concurrent crawling on a thread pool, or with httpx + asyncio
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin, urlparse
 import time
 import logging
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
 import re
+import sys
+import threading
 
 from ..utils.url_validator import URLValidator
 
+try:
+    from pybloomfilter import BloomFilter
+except ImportError:
+    BloomFilter = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Runs of whitespace collapsed to a single space in extracted text
+_WS_RE = re.compile(r'\s+')
+
+# Hrefs that never lead to a crawlable page: in-page anchors and
+# non-HTTP schemes
+_SKIP_HREF_RE = re.compile(r'^(?:#|javascript:|mailto:|tel:|data:|ftp:)', re.IGNORECASE)
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# False-positive rate of the optional visited-URL Bloom filter
+BLOOM_ERROR_RATE = 0.001
+
+# Elements dropped before extraction, and the elements collected from the rest
+_NON_CONTENT_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside']
+_EXTRACT_SELECTOR = 'title, meta, h1, h2, h3, h4, h5, h6, a[href]'
+_EXTRACT_SELECTOR_NO_METADATA = 'title, h1, a[href]'
+
+# Transient failures are retried with exponential backoff
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
 
-@dataclass
+# Response bodies are streamed and cut off at this size, so a large asset
+# linked by accident cannot blow up memory
+MAX_PAGE_BYTES = 5_000_000
+STREAM_CHUNK_SIZE = 65536
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ScrapedPage:
     """
     Data class to store information about a scraped page.
 
+    On Python 3.10+ the class uses ``__slots__``, which keeps per-page
+    memory down on large crawls.
+
     Attributes:
         url (str): The URL of the page
         title (str): Page title
@@ -69,7 +111,11 @@ class WebScraper:
         max_pages: int = 50,
         timeout: int = 10,
         delay: float = 1.0,
-        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        max_concurrency: int = 10,
+        bloom_capacity: Optional[int] = None,
+        max_visited_exact: int = 1000,
+        extract_metadata: bool = True
     ):
         """
         Initialize the WebScraper.
@@ -78,32 +124,89 @@ class WebScraper:
             max_depth (int): Maximum depth for crawling subpages
             max_pages (int): Maximum number of pages to scrape
             timeout (int): Request timeout in seconds
-            delay (float): Delay between requests in seconds
+            delay (float): Minimum seconds between request starts to the same host
             user_agent (str): User agent string for requests
+            max_concurrency (int): Number of concurrent crawl workers
+            bloom_capacity (Optional[int]): Track visited URLs in a Bloom filter
+                sized for this many URLs instead of an exact set, for very
+                large crawls (requires pybloomfiltermmap3)
+            max_visited_exact (int): Recently visited URLs kept exactly in
+                front of the Bloom filter
+            extract_metadata (bool): Collect meta tags and headings into
+                ScrapedPage.metadata; disable when only the text is needed
         """
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.timeout = timeout
         self.delay = delay
         self.user_agent = user_agent
+        self.max_concurrency = max_concurrency
+        self.max_visited_exact = max_visited_exact
+        self.extract_metadata = extract_metadata
+
+        if bloom_capacity and BloomFilter is None:
+            logger.warning("pybloomfiltermmap3 is not installed; tracking visited URLs in a set")
+            bloom_capacity = None
+        self.bloom_capacity = bloom_capacity
 
         self.url_validator = URLValidator()
+
+        # Visited URLs: an exact set by default. With a Bloom filter, only
+        # the most recent URLs are kept exactly, in _recent_urls.
         self.visited_urls: Set[str] = set()
+        self._recent_urls: OrderedDict = OrderedDict()
+        self._bloom = self._new_bloom()
+        self._visited_count = 0
         self.scraped_pages: List[ScrapedPage] = []
 
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': self.user_agent})
+        # Column views of scraped_pages, filled as pages are scraped
+        self._urls: List[str] = []
+        self._titles: List[str] = []
+        self._contents: List[str] = []
+        self._metadatas: List[Dict] = []
+
+        # Optional per-page callback for the current crawl
+        self._on_page: Optional[Callable[[ScrapedPage], None]] = None
+
+        # Pages currently being fetched by the async crawl workers
+        self._in_flight = 0
+
+        # Per-host rate limiting: earliest start time of the next request
+        # to each host, shared by all crawl workers
+        self._next_allowed: Dict[str, float] = {}
+        self._rate_lock = threading.Lock()
+
+        # One HTTP/2 client shared by the crawl threads: requests to the same
+        # host are multiplexed over a single TLS connection instead of each
+        # thread holding its own keep-alive connection
+        self.client = httpx.Client(
+            http2=True,
+            timeout=self.timeout,
+            headers={'User-Agent': self.user_agent},
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
 
-    def scrape_website(self, start_url: str) -> List[ScrapedPage]:
+    def scrape_website(
+        self,
+        start_url: str,
+        on_page: Optional[Callable[[ScrapedPage], None]] = None
+    ) -> List[ScrapedPage]:
         """
         Scrape a website starting from the given URL.
 
         This method performs a breadth-first crawl of the website,
         extracting content from the main page and all discoverable subpages
-        within the same domain.
+        within the same domain. Up to ``max_concurrency`` pages are fetched
+        at once on worker threads sharing one HTTP/2 client.
 
         Args:
             start_url (str): The starting URL to scrape
+            on_page (Optional[Callable]): Called with each page as soon as it
+                is scraped, e.g. to stream pages into the database
 
         Returns:
             List[ScrapedPage]: List of all scraped pages
@@ -119,72 +222,231 @@ class WebScraper:
         logger.info(f"Starting scrape of {normalized_url}")
 
         # Reset state
-        self.visited_urls.clear()
-        self.scraped_pages.clear()
+        self._reset()
+        self._on_page = on_page
 
         # Start crawling
-        self._crawl_recursive(normalized_url, depth=0)
+        self._crawl(normalized_url)
 
         logger.info(f"Scraping complete. Total pages scraped: {len(self.scraped_pages)}")
         return self.scraped_pages
 
-    def _crawl_recursive(self, url: str, depth: int):
+    async def scrape_website_async(
+        self,
+        start_url: str,
+        on_page: Optional[Callable[[ScrapedPage], None]] = None
+    ) -> List[ScrapedPage]:
         """
-        Recursively crawl pages starting from the given URL.
+        Scrape a website concurrently with a pool of crawl workers.
+
+        ``max_concurrency`` workers share one HTTP/2 client and pull
+        ``(url, depth)`` items from a queue, pushing newly discovered
+        same-domain links back onto it. Unlike a level-by-level crawl, a
+        slow page never holds up the rest of the crawl. Requests to a host
+        start at least ``delay`` seconds apart to stay polite.
 
         Args:
-            url (str): Current URL to crawl
-            depth (int): Current crawl depth
+            start_url (str): The starting URL to scrape
+            on_page (Optional[Callable]): Called with each page as soon as it
+                is scraped, e.g. to stream pages into the database
+
+        Returns:
+            List[ScrapedPage]: List of all scraped pages
+
+        Raises:
+            ValueError: If the start URL is invalid
         """
-        # Check stopping conditions
-        if depth > self.max_depth:
-            logger.debug(f"Max depth reached for {url}")
-            return
+        normalized_url = self.url_validator.normalize_url(start_url)
+        if not normalized_url:
+            raise ValueError(f"Invalid URL: {start_url}")
 
-        if len(self.scraped_pages) >= self.max_pages:
-            logger.info(f"Max pages ({self.max_pages}) reached")
-            return
+        logger.info(f"Starting concurrent scrape of {normalized_url}")
 
-        # Clean and normalize URL
-        url = self.url_validator.clean_url(url)
+        # Reset state
+        self._reset()
+        self._on_page = on_page
+        self._in_flight = 0
+
+        start = self.url_validator.clean_url(normalized_url)
+        self._mark_visited(start)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait((start, 0))
+
+        # Signalled whenever an in-flight fetch settles
+        page_slots = asyncio.Condition()
+
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            headers={'User-Agent': self.user_agent},
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        ) as client:
+            workers = [
+                asyncio.create_task(self._crawl_worker(client, queue, page_slots))
+                for _ in range(self.max_concurrency)
+            ]
 
-        # Skip if already visited
-        if url in self.visited_urls:
-            return
+            # Every queued URL is marked done, so this returns once the
+            # frontier is exhausted or the page limit stops new fetches
+            await queue.join()
 
-        # Mark as visited
-        self.visited_urls.add(url)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-        try:
-            # Scrape the page
-            logger.info(f"Scraping [{depth}]: {url}")
-            scraped_page = self._scrape_page(url, depth)
+        logger.info(f"Scraping complete. Total pages scraped: {len(self.scraped_pages)}")
+        return self.scraped_pages
+
+    async def _crawl_worker(
+        self,
+        client: httpx.AsyncClient,
+        queue: asyncio.Queue,
+        page_slots: asyncio.Condition
+    ):
+        """
+        Fetch queued pages until cancelled, queueing their same-domain links.
 
-            if scraped_page:
-                self.scraped_pages.append(scraped_page)
+        A worker only fetches while scraped plus in-flight pages are below
+        ``max_pages``. When all slots are taken it waits for an in-flight
+        fetch to settle rather than dropping its URL, since that fetch may
+        still fail; URLs are only dropped once the limit is actually reached.
 
-                # Extract the base domain
-                base_domain = self.url_validator.get_domain(url)
+        Args:
+            client (httpx.AsyncClient): Shared HTTP client
+            queue (asyncio.Queue): The crawl frontier
+            page_slots (asyncio.Condition): Notified when an in-flight fetch settles
+        """
+        while True:
+            url, depth = await queue.get()
 
-                # Find and crawl subpages
-                for link in scraped_page.links:
-                    # Check if we've hit the page limit
+            try:
+                async with page_slots:
+                    await page_slots.wait_for(self._page_slot_available)
                     if len(self.scraped_pages) >= self.max_pages:
-                        break
+                        continue
+                    self._in_flight += 1
+
+                try:
+                    page = await self._scrape_page_async(client, url, depth)
+                    if page is not None:
+                        self._record_page(page)
+                finally:
+                    # Release the slot only after the page is recorded, so
+                    # waiting workers see the updated page count
+                    async with page_slots:
+                        self._in_flight -= 1
+                        page_slots.notify_all()
+
+                if page is not None and depth < self.max_depth:
+                    for link in self._claim_links(page):
+                        queue.put_nowait((link, depth + 1))
+
+            except Exception as e:
+                logger.error(f"Error crawling {url}: {str(e)}")
+
+            finally:
+                queue.task_done()
+
+    def _page_slot_available(self) -> bool:
+        """Whether a worker may stop waiting: a page slot is free or the limit is reached."""
+        scraped = len(self.scraped_pages)
+        return scraped >= self.max_pages or scraped + self._in_flight < self.max_pages
+
+    def _crawl(self, start_url: str):
+        """
+        Breadth-first crawl from the given URL on a pool of worker threads.
 
-                    # Only follow links in the same domain
-                    if self.url_validator.is_same_domain(url, link):
-                        # Polite crawling: add delay between requests
-                        time.sleep(self.delay)
-                        self._crawl_recursive(link, depth + 1)
+        Up to ``max_concurrency`` queued pages are fetched at once; fetches
+        block on socket I/O, which releases the GIL, so the threads overlap
+        their round trips. Results are handled on the calling thread, so the
+        visited set and the page lists need no locking.
 
-        except Exception as e:
-            logger.error(f"Error crawling {url}: {str(e)}")
+        Args:
+            start_url (str): URL to start crawling from
+        """
+        frontier = deque([(self.url_validator.clean_url(start_url), 0)])
+        self._mark_visited(frontier[0][0])
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while frontier and len(self.scraped_pages) < self.max_pages:
+                # Take a wave of pages without overshooting the page limit
+                wave = min(self.max_concurrency, self.max_pages - len(self.scraped_pages))
+                futures = {}
+                while frontier and len(futures) < wave:
+                    url, depth = frontier.popleft()
+                    futures[executor.submit(self._scrape_page, url, depth)] = url
+
+                for future in as_completed(futures):
+                    try:
+                        scraped_page = future.result()
+                    except Exception as e:
+                        logger.error(f"Error crawling {futures[future]}: {str(e)}")
+                        continue
+
+                    if not scraped_page or len(self.scraped_pages) >= self.max_pages:
+                        continue
+
+                    self._record_page(scraped_page)
+
+                    if scraped_page.depth < self.max_depth:
+                        depth = scraped_page.depth + 1
+                        frontier.extend((link, depth) for link in self._claim_links(scraped_page))
+
+    def _claim_links(self, page: ScrapedPage) -> List[str]:
+        """
+        Claim a page's links for the crawl frontier.
+
+        Links are claimed when they are discovered rather than when they are
+        fetched, so each URL enters the frontier at most once, at the
+        shallowest depth it was seen. A page's links enter the frontier as
+        one batch, grouped by host.
+
+        Args:
+            page (ScrapedPage): A freshly scraped page
+
+        Returns:
+            List[str]: Cleaned same-domain links not visited before
+        """
+        new_links = []
+
+        # Resolve the page's domain once rather than once per link
+        get_domain = self.url_validator.get_domain
+        page_domain = get_domain(page.url)
+        if not page_domain:
+            return new_links
+
+        for link in page.links:
+            # Only follow links in the same domain
+            if get_domain(link) != page_domain:
+                continue
+
+            link = self.url_validator.clean_url(link)
+            if not self._is_visited(link):
+                self._mark_visited(link)
+                new_links.append(link)
+
+        # Group the batch by host, in order of first appearance, so URLs on
+        # the same host are fetched back to back over its warm connection
+        by_host: Dict[str, List[str]] = {}
+        for link in new_links:
+            by_host.setdefault(self.url_validator.get_netloc(link) or '', []).append(link)
+
+        return [link for host_links in by_host.values() for link in host_links]
 
     def _scrape_page(self, url: str, depth: int) -> Optional[ScrapedPage]:
         """
         Scrape a single page and extract its content.
 
+        The body is streamed, non-HTML responses are skipped, and at most
+        ``MAX_PAGE_BYTES`` are downloaded. Connection errors, timeouts and
+        ``RETRY_STATUSES`` responses are retried up to ``MAX_RETRIES`` times
+        with exponential backoff.
+
         Args:
             url (str): URL of the page to scrape
             depth (int): Current crawl depth
@@ -192,29 +454,222 @@ class WebScraper:
         Returns:
             Optional[ScrapedPage]: Scraped page data or None if failed
         """
-        try:
-            # Make the request
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+        # Polite crawling: wait for this host's next request slot
+        wait = self._reserve_request_slot(url)
+        if wait > 0:
+            time.sleep(wait)
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'lxml')
+        logger.info(f"Scraping [{depth}]: {url}")
+
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(self._retry_backoff(attempt))
 
-            # Extract title
-            title = self._extract_title(soup)
+            try:
+                with self.client.stream('GET', url) as response:
+                    if self._should_retry(attempt, status_code=response.status_code):
+                        continue
 
-            # Extract main content
-            content = self._extract_content(soup)
+                    response.raise_for_status()
 
-            # Extract metadata
-            metadata = self._extract_metadata(soup)
+                    # Skip images, PDFs, archives etc. before downloading them
+                    if not self._is_html(response.headers.get('Content-Type', '')):
+                        logger.info(f"Skipping non-HTML page: {url}")
+                        return None
 
-            # Extract links
-            links = self._extract_links(soup, url)
+                    body = bytearray()
+                    for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                        body.extend(chunk)
+                        if len(body) >= MAX_PAGE_BYTES:
+                            logger.warning(f"Truncated {url} at {MAX_PAGE_BYTES} bytes")
+                            break
+
+                return self._parse_page(url, depth, self._decode_body(body, response.encoding))
+
+            except httpx.HTTPError as e:
+                if self._should_retry(attempt, error=e):
+                    continue
+                logger.error(f"Request error for {url}: {str(e)}")
+                return None
+
+    async def _scrape_page_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        depth: int
+    ) -> Optional[ScrapedPage]:
+        """
+        Fetch a single page with the async client and extract its content.
+
+        Like ``_scrape_page``, the body is streamed, non-HTML responses are
+        skipped, at most ``MAX_PAGE_BYTES`` are downloaded, and transient
+        failures are retried with exponential backoff.
+
+        Args:
+            client (httpx.AsyncClient): Shared HTTP client
+            url (str): URL of the page to scrape
+            depth (int): Current crawl depth
+
+        Returns:
+            Optional[ScrapedPage]: Scraped page data or None if failed
+        """
+        # Polite crawling: wait for this host's next request slot
+        wait = self._reserve_request_slot(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        logger.info(f"Scraping [{depth}]: {url}")
+
+        for attempt in range(MAX_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(self._retry_backoff(attempt))
+
+            try:
+                async with client.stream('GET', url) as response:
+                    if self._should_retry(attempt, status_code=response.status_code):
+                        continue
+
+                    response.raise_for_status()
+
+                    # Skip images, PDFs, archives etc. before downloading them
+                    if not self._is_html(response.headers.get('Content-Type', '')):
+                        logger.info(f"Skipping non-HTML page: {url}")
+                        return None
+
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        body.extend(chunk)
+                        if len(body) >= MAX_PAGE_BYTES:
+                            logger.warning(f"Truncated {url} at {MAX_PAGE_BYTES} bytes")
+                            break
+
+                return self._parse_page(url, depth, self._decode_body(body, response.encoding))
+
+            except httpx.HTTPError as e:
+                if self._should_retry(attempt, error=e):
+                    continue
+                logger.error(f"Request error for {url}: {str(e)}")
+                return None
+
+    @staticmethod
+    def _retry_backoff(attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (exponential backoff)."""
+        return RETRY_BACKOFF * 2 ** (attempt - 1)
+
+    @staticmethod
+    def _should_retry(
+        attempt: int,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None
+    ) -> bool:
+        """
+        Decide whether a failed fetch attempt is retried.
+
+        Shared by the sync and async fetch paths. Connection errors, timeouts
+        and ``RETRY_STATUSES`` responses are retried, up to ``MAX_RETRIES``
+        times; other HTTP errors are final.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that just ran
+            status_code (Optional[int]): Response status, if a response arrived
+            error (Optional[Exception]): Error raised by the attempt, if any
+
+        Returns:
+            bool: True if the request should be sent again
+        """
+        if attempt >= MAX_RETRIES:
+            return False
+
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+
+        return status_code in RETRY_STATUSES
+
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        Reserve the next request slot for the URL's host.
+
+        Request starts to one host are spaced ``delay`` seconds apart,
+        however many workers are crawling it, while requests to other hosts
+        are not held back. Slots are reserved rather than waited for under
+        the lock, so the same limiter serves the thread pool and the async
+        workers.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        domain = self.url_validator.get_domain(url) or ''
+
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(domain, 0.0))
+            self._next_allowed[domain] = start + self.delay
+
+        return start - now
+
+    @staticmethod
+    def _is_html(content_type: str) -> bool:
+        """
+        Check whether a response Content-Type can be parsed as a page.
+
+        A missing header is given the benefit of the doubt.
+
+        Args:
+            content_type (str): Value of the Content-Type header
+
+        Returns:
+            bool: True if the body should be downloaded and parsed
+        """
+        return not content_type or 'html' in content_type.lower()
+
+    @staticmethod
+    def _decode_body(body: bytearray, encoding: Optional[str]) -> str:
+        """
+        Decode a response body with the response charset.
+
+        Lexbor does no charset detection on bytes, so pages are decoded
+        here. Undecodable bytes, e.g. a character cut at ``MAX_PAGE_BYTES``,
+        become replacement characters instead of losing the text node.
+
+        Args:
+            body (bytearray): Raw response body
+            encoding (Optional[str]): Charset reported by the response
+
+        Returns:
+            str: Decoded HTML
+        """
+        try:
+            return body.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            # Unknown charset name in the Content-Type header
+            return body.decode('utf-8', errors='replace')
+
+    def _parse_page(self, url: str, depth: int, html: str) -> Optional[ScrapedPage]:
+        """
+        Parse a fetched page and build its ScrapedPage.
+
+        Args:
+            url (str): URL of the page
+            depth (int): Current crawl depth
+            html (str): Decoded response body
+
+        Returns:
+            Optional[ScrapedPage]: Scraped page data or None if parsing failed
+        """
+        try:
+            # Parse HTML
+            tree = LexborHTMLParser(html)
+
+            # Extract title, content, metadata and links in one pass
+            title, content, metadata, links = self._extract_all(tree, url)
 
             # Create ScrapedPage object
             scraped_page = ScrapedPage(
-                url=url,
+                # Interned, since URLs are compared against the visited set
+                url=sys.intern(url),
                 title=title,
                 content=content,
                 metadata=metadata,
@@ -226,104 +681,170 @@ class WebScraper:
             logger.debug(f"Successfully scraped: {url} (Content length: {len(content)} chars)")
             return scraped_page
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error for {url}: {str(e)}")
-            return None
         except Exception as e:
             logger.error(f"Unexpected error scraping {url}: {str(e)}")
             return None
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract the page title."""
-        if soup.title:
-            return soup.title.string.strip() if soup.title.string else ""
+    def _extract_all(self, tree: LexborHTMLParser, base_url: str) -> Tuple[str, str, Dict, List[str]]:
+        """
+        Extract the title, main text, metadata and links of a page.
 
-        # Try h1 as fallback
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text().strip()
+        Non-content elements (script, style, nav, footer, header, aside) are
+        removed first. One ``css()`` call with a comma-joined selector then
+        fetches the title, meta tags, headings and anchors, and the remaining
+        text is read once. Lexbor returns the matches grouped by selector
+        (title, meta, all h1, all h2, ..., anchors), each group in document
+        order, so headings are listed by level and links in anchor order.
+        With ``extract_metadata`` off, meta tags and headings are not
+        selected and the metadata is empty.
 
-        return "Untitled"
+        Args:
+            tree (LexborHTMLParser): Parsed HTML
+            base_url (str): Base URL for resolving relative links
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+        Returns:
+            Tuple: (title, content, metadata, links)
         """
-        Extract the main text content from the page.
+        # Remove script, style and other non-content elements in one native call
+        tree.strip_tags(_NON_CONTENT_TAGS)
 
-        This method removes script, style, and other non-content elements,
-        then extracts and cleans the text.
-        """
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
+        title = None
+        first_h1 = ""
+        metadata = {}
+        headings = []
+        hrefs = []
 
-        # Get text
-        text = soup.get_text()
+        selector = _EXTRACT_SELECTOR if self.extract_metadata else _EXTRACT_SELECTOR_NO_METADATA
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        for node in tree.css(selector):
+            tag = node.tag
 
-        return text
+            if tag == 'a':
+                href = (node.attributes.get('href') or '').strip()
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
-        """
-        Extract metadata from the page (description, keywords, author, etc.).
-        """
-        metadata = {}
+                # Skip anchors, javascript, mailto, etc.
+                if _SKIP_HREF_RE.match(href):
+                    continue
 
-        # Extract meta tags
-        meta_tags = soup.find_all('meta')
+                # Links differing only by fragment are the same page
+                href = href.split('#', 1)[0]
+                if href:
+                    hrefs.append(href)
 
-        for tag in meta_tags:
-            # Get name and content
-            name = tag.get('name', tag.get('property', ''))
-            content = tag.get('content', '')
+            elif tag == 'meta':
+                attributes = node.attributes
+                name = attributes.get('name') or attributes.get('property')
+                content = attributes.get('content')
 
-            if name and content:
-                metadata[name] = content
+                if name and content:
+                    metadata[name] = content
 
-        # Extract headings for structure
-        headings = []
-        for i in range(1, 7):  # h1 to h6
-            for heading in soup.find_all(f'h{i}'):
-                headings.append({
-                    'level': i,
-                    'text': heading.get_text().strip()
-                })
+            elif tag == 'title':
+                if title is None:
+                    title = node.text(strip=True)
+
+            elif self.extract_metadata:
+                # Headings give the page structure
+                text = node.text(strip=True)
+                headings.append({'level': int(tag[1]), 'text': text})
+
+                if tag == 'h1' and not first_h1:
+                    first_h1 = text
+
+            elif not first_h1:
+                # Only the first h1 is needed, as the title fallback
+                first_h1 = node.text(strip=True)
 
         if headings:
             metadata['headings'] = headings
 
-        return metadata
+        # Make absolute URLs for the whole page at once. The set keeps
+        # de-duplication linear on link-heavy pages; the list keeps the
+        # order of the anchors.
+        links = []
+        seen_links = set()
+        for absolute_url in self.url_validator.make_absolute_batch(base_url, hrefs):
+            if absolute_url not in seen_links:
+                seen_links.add(absolute_url)
+                links.append(absolute_url)
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """
-        Extract all valid links from the page.
+        # Fall back to the first h1 when there is no <title>
+        if title is None:
+            title = first_h1 or "Untitled"
 
-        Args:
-            soup (BeautifulSoup): Parsed HTML
-            base_url (str): Base URL for resolving relative links
+        # Get text, with a space between text nodes, and clean up whitespace
+        root = tree.body or tree.root
+        text = root.text(separator=' ') if root is not None else ""
+        content = _WS_RE.sub(' ', text).strip()
 
-        Returns:
-            List[str]: List of absolute URLs
+        return title, content, metadata, links
+
+    def _new_bloom(self):
+        """Create an empty visited-URL Bloom filter, or None if disabled."""
+        if not self.bloom_capacity:
+            return None
+
+        return BloomFilter(self.bloom_capacity, BLOOM_ERROR_RATE, None)
+
+    def _is_visited(self, url: str) -> bool:
         """
-        links = []
+        Check whether a URL was already claimed in this crawl.
 
-        for anchor in soup.find_all('a', href=True):
-            href = anchor['href']
+        With a Bloom filter, a false positive (about ``BLOOM_ERROR_RATE``)
+        only means an occasional page is skipped.
+        """
+        if self._bloom is None:
+            return url in self.visited_urls
 
-            # Skip anchors, javascript, mailto, etc.
-            if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
-                continue
+        return url in self._recent_urls or url in self._bloom
 
-            # Make absolute URL
-            absolute_url = self.url_validator.make_absolute_url(base_url, href)
+    def _mark_visited(self, url: str):
+        """Record a URL as claimed in this crawl."""
+        self._visited_count += 1
 
-            if absolute_url and absolute_url not in links:
-                links.append(absolute_url)
+        if self._bloom is None:
+            self.visited_urls.add(url)
+            return
+
+        self._bloom.add(url)
+        self._recent_urls[url] = None
+        if len(self._recent_urls) > self.max_visited_exact:
+            self._recent_urls.popitem(last=False)
 
-        return links
+    def _reset(self):
+        """Clear all per-crawl state."""
+        self.visited_urls.clear()
+        self._recent_urls.clear()
+        self._bloom = self._new_bloom()
+        self._visited_count = 0
+        self.scraped_pages.clear()
+        self._urls.clear()
+        self._titles.clear()
+        self._contents.clear()
+        self._metadatas.clear()
+
+    def _record_page(self, page: ScrapedPage):
+        """Store a scraped page and append its fields to the column lists."""
+        self.scraped_pages.append(page)
+        self._urls.append(page.url)
+        self._titles.append(page.title)
+        self._contents.append(page.content)
+        self._metadatas.append(page.metadata)
+
+        if self._on_page:
+            self._on_page(page)
+
+    def get_columns(self) -> Tuple[List[str], List[str], List[str], List[Dict]]:
+        """
+        Get the scraped pages as parallel column lists.
+
+        The lists are built while crawling, so no extra pass over the pages
+        is needed to hand them to the database.
+
+        Returns:
+            Tuple: (urls, titles, contents, metadatas)
+        """
+        return self._urls, self._titles, self._contents, self._metadatas
 
     def get_scraped_pages(self) -> List[ScrapedPage]:
         """
@@ -341,14 +862,29 @@ class WebScraper:
         Returns:
             Dict: Summary statistics
         """
+        max_depth = 0
+        total_length = 0
+        domains = set()
+
+        # One pass over the pages for all statistics
+        for page in self.scraped_pages:
+            if page.depth > max_depth:
+                max_depth = page.depth
+            total_length += len(page.content)
+            domains.add(self.url_validator.get_domain(page.url))
+
         return {
             'total_pages': len(self.scraped_pages),
-            'total_urls_visited': len(self.visited_urls),
-            'max_depth_reached': max([page.depth for page in self.scraped_pages], default=0),
-            'total_content_length': sum([len(page.content) for page in self.scraped_pages]),
-            'unique_domains': len(set([self.url_validator.get_domain(page.url) for page in self.scraped_pages]))
+            'total_urls_visited': self._visited_count,
+            'max_depth_reached': max_depth,
+            'total_content_length': total_length,
+            'unique_domains': len(domains)
         }
 
+    def close(self):
+        """Close the HTTP client and its pooled connections."""
+        self.client.close()
+
 
 if __name__ == "__main__":
     # Test the scraper
@@ -6,15 +6,167 @@ It ensures that URLs are properly formatted and accessible before scraping.
 """
 
 import re
-import validators
-from urllib.parse import urlparse, urljoin
-from typing import Optional
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse, urljoin
+from typing import Iterable, List, Optional
 import logging
 
+try:
+    import validators
+except ImportError:
+    validators = None
+
+try:
+    import tldextract
+    # Use the Public Suffix List snapshot bundled with tldextract, so
+    # domain checks never fetch the list over the network mid-crawl.
+    # Private suffixes (github.io, netlify.app, blogspot.com, ...) are
+    # included, so each tenant of a shared host is its own domain.
+    _TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), include_psl_private_domains=True)
+except ImportError:
+    _TLD_EXTRACT = None
+
+try:
+    from url_normalize import url_normalize
+except ImportError:
+    url_normalize = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized URLs, so long-lived sessions don't grow unbounded
+URL_CACHE_SIZE = 131072
+
+# Cheap structural check for http(s) URLs with a host, compiled once.
+# The much slower validators.url is only used for strict checks.
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse(url: str) -> ParseResult:
+    """
+    Memoized urlparse.
+
+    A discovered link is parsed by several checks (normalization, domain
+    comparison, absolute check); ParseResult is an immutable namedtuple,
+    so the cached object is safe to share.
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _is_valid_url(url: str, strict: bool = False) -> bool:
+    """Memoized implementation of URLValidator.is_valid_url."""
+    if not url:
+        return False
+
+    if not _URL_RE.match(url):
+        return False
+
+    # Full RFC-style validation, e.g. for user input
+    if strict and validators is not None:
+        return bool(validators.url(url))
+
+    return True
+
+
+def _http_url(url: str) -> Optional[str]:
+    """
+    Cheap check that a URL built from a trusted base is http(s) with a host.
+
+    Joining against a valid base can only go wrong by switching scheme
+    (mailto:, javascript:, ...) or by losing the host, so this is all the
+    validation resolved links need. Schemes are case-insensitive; the URL
+    is returned with its scheme lowercased, or None if it fails the check.
+    """
+    scheme = url[:8].lower()
+    if scheme == 'https://':
+        rest = url[8:]
+    elif scheme.startswith('http://'):
+        scheme, rest = 'http://', url[7:]
+    else:
+        return None
+
+    if not rest or rest[0] in '/?#':
+        return None
+
+    return scheme + rest
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _normalize_url(url: str) -> Optional[str]:
+    """Memoized implementation of URLValidator.normalize_url."""
+    if not url:
+        return None
+
+    url = url.strip()
+
+    # Add scheme if missing
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    parsed = _parse(url)
+    scheme, netloc = parsed.scheme, parsed.netloc
+
+    if url_normalize is not None:
+        # Lowercase scheme and host, IDNA-encode the host and drop default
+        # ports. Only the authority goes through url_normalize: it unquotes
+        # paths and queries, and decoding e.g. %2F to / would change the
+        # resource that gets requested.
+        try:
+            authority = _parse(url_normalize(f"{scheme}://{netloc}", default_scheme='https'))
+            scheme, netloc = authority.scheme, authority.netloc
+        except Exception as e:
+            logger.error(f"Error normalizing {url}: {str(e)}")
+            return None
+
+    # Reconstruct URL without fragment
+    normalized = f"{scheme}://{netloc}{parsed.path}"
+
+    if parsed.query:
+        normalized += f"?{parsed.query}"
+
+    # Drop the slash of a bare root, so site URLs (stored as website_url
+    # and used in document IDs) keep one form; clean_url does the same for
+    # discovered links
+    if normalized.endswith('/') and _parse(normalized).path == '/':
+        normalized = normalized[:-1]
+
+    # Start URLs come from users, so validate them strictly
+    if _is_valid_url(normalized, strict=True):
+        return normalized
+
+    return None
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _get_netloc(url: str) -> Optional[str]:
+    """Memoized implementation of URLValidator.get_netloc."""
+    try:
+        parsed = _parse(url)
+        return parsed.netloc if parsed.netloc else None
+    except Exception as e:
+        logger.error(f"Error extracting domain from {url}: {str(e)}")
+        return None
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _get_domain(url: str) -> Optional[str]:
+    """Memoized implementation of URLValidator.get_domain."""
+    netloc = _get_netloc(url)
+    if not netloc:
+        return None
+
+    # Host names are case-insensitive
+    netloc = netloc.lower()
+    if _TLD_EXTRACT is None:
+        return netloc
+
+    # Registrable domain per the Public Suffix List; hosts without one
+    # (IP addresses, localhost) fall back to the netloc
+    return _TLD_EXTRACT(url).registered_domain.lower() or netloc
+
 
 class URLValidator:
     """
@@ -32,12 +184,18 @@ class URLValidator:
         pass
 
     @staticmethod
-    def is_valid_url(url: str) -> bool:
+    def is_valid_url(url: str, strict: bool = False) -> bool:
         """
         Check if a URL is valid and well-formed.
 
+        The default check is a precompiled regex for http(s) URLs with a
+        host; ``strict`` additionally runs the full ``validators.url`` check
+        when the validators package is installed.
+        Results are memoized, since a crawl validates the same URLs repeatedly.
+
         Args:
             url (str): The URL to validate
+            strict (bool): Also run the slower, stricter validators check
 
         Returns:
             bool: True if URL is valid, False otherwise
@@ -49,31 +207,25 @@ class URLValidator:
             >>> validator.is_valid_url("not-a-url")
             False
         """
-        if not url or not isinstance(url, str):
+        # Checked before the cache, which would fail to hash e.g. a list
+        if not isinstance(url, str):
             return False
 
-        # Use validators library for basic validation
-        if not validators.url(url):
-            return False
-
-        # Additional checks
-        parsed = urlparse(url)
-
-        # Must have scheme (http/https)
-        if parsed.scheme not in ['http', 'https']:
-            return False
-
-        # Must have netloc (domain)
-        if not parsed.netloc:
-            return False
-
-        return True
+        return _is_valid_url(url, strict)
 
     @staticmethod
     def normalize_url(url: str) -> Optional[str]:
         """
         Normalize a URL by adding scheme if missing and removing fragments.
 
+        With url-normalize installed, the scheme and host are also
+        lowercased and default ports dropped; the path and query are kept
+        as given, percent-encoding included. A bare root URL is returned
+        without a trailing slash either way.
+
+        The result is strictly validated. Results are memoized, since a crawl
+        normalizes the same URLs repeatedly.
+
         Args:
             url (str): The URL to normalize
 
@@ -84,56 +236,67 @@ class URLValidator:
             >>> validator = URLValidator()
             >>> validator.normalize_url("example.com")
             'https://example.com'
+            >>> validator.normalize_url("https://example.com/")
+            'https://example.com'
         """
-        if not url:
+        if not isinstance(url, str):
             return None
 
-        url = url.strip()
+        return _normalize_url(url)
 
-        # Add scheme if missing
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+    @staticmethod
+    def get_domain(url: str) -> Optional[str]:
+        """
+        Extract the registrable domain from a URL.
 
-        # Parse and reconstruct URL without fragment
-        parsed = urlparse(url)
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        The domain is resolved against the Public Suffix List, so
+        ``www.example.com`` and ``blog.example.com`` share ``example.com``
+        while ``a.co.uk`` and ``b.co.uk`` stay apart, as do tenants of
+        private suffixes such as ``a.github.io`` and ``b.github.io``. Without tldextract
+        installed, this falls back to the netloc. Results are memoized,
+        since every discovered link is domain-checked.
 
-        if parsed.query:
-            normalized += f"?{parsed.query}"
+        Args:
+            url (str): The URL to extract domain from
 
-        # Validate the normalized URL
-        if URLValidator.is_valid_url(normalized):
-            return normalized
+        Returns:
+            Optional[str]: Domain name or None if invalid
 
-        return None
+        Example:
+            >>> validator = URLValidator()
+            >>> validator.get_domain("https://www.example.com/page")
+            'example.com'
+        """
+        if not isinstance(url, str):
+            return None
+
+        return _get_domain(url)
 
     @staticmethod
-    def get_domain(url: str) -> Optional[str]:
+    def get_netloc(url: str) -> Optional[str]:
         """
-        Extract the domain (netloc) from a URL.
+        Extract the network location (host and port) from a URL.
 
         Args:
-            url (str): The URL to extract domain from
+            url (str): The URL to extract the netloc from
 
         Returns:
-            Optional[str]: Domain name or None if invalid
+            Optional[str]: Netloc or None if invalid
 
         Example:
             >>> validator = URLValidator()
-            >>> validator.get_domain("https://www.example.com/page")
+            >>> validator.get_netloc("https://www.example.com/page")
             'www.example.com'
         """
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc if parsed.netloc else None
-        except Exception as e:
-            logger.error(f"Error extracting domain from {url}: {str(e)}")
+        if not isinstance(url, str):
             return None
 
+        return _get_netloc(url)
+
     @staticmethod
     def is_same_domain(url1: str, url2: str) -> bool:
         """
-        Check if two URLs belong to the same domain.
+        Check if two URLs belong to the same registrable domain.
 
         Args:
             url1 (str): First URL
@@ -169,7 +332,7 @@ class URLValidator:
         Returns:
             bool: True if absolute URL, False otherwise
         """
-        parsed = urlparse(url)
+        parsed = _parse(url)
         return bool(parsed.scheme and parsed.netloc)
 
     @staticmethod
@@ -177,6 +340,11 @@ class URLValidator:
         """
         Convert a relative URL to an absolute URL using a base URL.
 
+        The base URL is trusted to be valid (crawled pages come from
+        normalized URLs), so the result is only checked to be an http(s)
+        URL with a host rather than fully re-validated. Call
+        ``is_valid_url`` when strict validation is needed.
+
         Args:
             base_url (str): The base URL
             relative_url (str): The relative URL
@@ -193,17 +361,73 @@ class URLValidator:
             'https://example.com/about'
         """
         try:
-            absolute = urljoin(base_url, relative_url)
-            return absolute if URLValidator.is_valid_url(absolute) else None
+            return _http_url(urljoin(base_url, relative_url.strip()))
         except Exception as e:
             logger.error(f"Error making absolute URL: {str(e)}")
             return None
 
+    @staticmethod
+    def make_absolute_batch(base_url: str, hrefs: Iterable[str]) -> List[str]:
+        """
+        Resolve all hrefs of one page against its URL.
+
+        The base URL is parsed once per page. Hrefs that are already
+        absolute, protocol-relative (``//host/...``) or root-relative
+        (``/path``) are resolved by string concatenation; only genuinely
+        relative hrefs and paths with dot segments go through ``urljoin``.
+        Fragments are dropped. As in ``make_absolute_url`` the base URL is
+        trusted, so results are only checked to be http(s) URLs with a host.
+
+        Args:
+            base_url (str): URL of the page the hrefs were found on
+            hrefs (Iterable[str]): Raw href values
+
+        Returns:
+            List[str]: Valid absolute URLs, in input order
+
+        Example:
+            >>> URLValidator.make_absolute_batch(
+            ...     "https://example.com/docs/page",
+            ...     ["/about", "intro#top", "//cdn.example.com/x"]
+            ... )
+            ['https://example.com/about', 'https://example.com/docs/intro', 'https://cdn.example.com/x']
+        """
+        base = _parse(base_url)
+        origin = f"{base.scheme}://{base.netloc}"
+        absolute_urls = []
+
+        for href in hrefs:
+            href = href.split('#', 1)[0]
+            if not href:
+                continue
+
+            if href[:8].lower().startswith(('http://', 'https://')):
+                absolute = href
+            elif '/.' in href:
+                # Dot segments need urljoin's path normalization
+                absolute = urljoin(base_url, href)
+            elif href.startswith('//'):
+                absolute = f"{base.scheme}:{href}"
+            elif href.startswith('/'):
+                absolute = origin + href
+            else:
+                absolute = urljoin(base_url, href)
+
+            absolute = _http_url(absolute)
+            if absolute:
+                absolute_urls.append(absolute)
+
+        return absolute_urls
+
     @staticmethod
     def clean_url(url: str) -> str:
         """
         Clean a URL by removing trailing slashes and normalizing.
 
+        The slash of a bare root is removed too, matching ``normalize_url``,
+        so a discovered ``https://example.com/`` and the start URL
+        ``https://example.com`` are the same crawl entry.
+
         Args:
             url (str): The URL to clean
 
@@ -211,8 +435,8 @@ class URLValidator:
             str: Cleaned URL
         """
         url = url.strip()
-        # Remove trailing slash unless it's the root
-        if url.endswith('/') and url.count('/') > 3:
+        # Remove trailing slash (keep "scheme://" itself intact)
+        if url.endswith('/') and url.count('/') >= 3:
             url = url[:-1]
         return url
 